@@ -1,24 +1,31 @@
 """A2A Server for the Knowledge Manager agent."""
 
-import sys
-
-import uvicorn
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import FastAPI, Request, Response
+
+from shared.a2a_utils import (
+    INTERNAL_ERROR,
+    INVALID_PARAMS,
+    METHOD_NOT_FOUND,
+    create_a2a_error_bytes,
+    create_a2a_response,
+    create_agent_card_bytes,
+)
+from shared.logging_config import setup_logging
+from shared.models import close_http_clients as close_model_clients
+from shared.server import ORJSONResponse, run_a2a_server
+from shared.token_manager import TokenManager
 
 from .agent import KnowledgeAgent
 from .config import get_settings
 
-sys.path.insert(0, "/app")
-from shared.a2a_utils import create_a2a_error, create_a2a_response, create_agent_card
-from shared.logging_config import setup_logging
-from shared.token_manager import TokenManager
-
 # Set up logging first
 settings = get_settings()
 logger = setup_logging("knowledge-agent", level="INFO")
 
-app = FastAPI(title="Knowledge Manager Agent", version="1.0.0")
+app = FastAPI(
+    title="Knowledge Manager Agent", version="1.0.0", default_response_class=ORJSONResponse
+)
 
 # Initialize TokenManager before agent creation
 TokenManager.initialize(settings)
@@ -28,32 +35,41 @@ agent = KnowledgeAgent()
 logger.info("Knowledge Agent initialized successfully")
 
 
+@app.on_event("shutdown")
+async def close_http_clients():
+    """Close pooled connections to Azure OpenAI."""
+    await close_model_clients()
+
+
+# The agent card never changes, so serialize it once at startup
+app.state.agent_card_bytes = create_agent_card_bytes(
+    name=settings.agent_name,
+    description=settings.agent_description,
+    url=f"http://localhost:{settings.port}",
+    skills=[
+        {
+            "id": "store-knowledge",
+            "name": "Store Knowledge",
+            "description": "Store research findings and explanations",
+        },
+        {
+            "id": "search-knowledge",
+            "name": "Search Knowledge",
+            "description": "Search for relevant past information",
+        },
+        {
+            "id": "get-context",
+            "name": "Get Context",
+            "description": "Get conversation context for a session",
+        },
+    ],
+)
+
+
 @app.get("/.well-known/agent.json")
 async def get_agent_card():
     """Return the A2A Agent Card for discovery."""
-    card = create_agent_card(
-        name=settings.agent_name,
-        description=settings.agent_description,
-        url=f"http://localhost:{settings.port}",
-        skills=[
-            {
-                "id": "store-knowledge",
-                "name": "Store Knowledge",
-                "description": "Store research findings and explanations",
-            },
-            {
-                "id": "search-knowledge",
-                "name": "Search Knowledge",
-                "description": "Search for relevant past information",
-            },
-            {
-                "id": "get-context",
-                "name": "Get Context",
-                "description": "Get conversation context for a session",
-            },
-        ],
-    )
-    return card.model_dump()
+    return Response(content=app.state.agent_card_bytes, media_type="application/json")
 
 
 @app.get("/health")
@@ -67,7 +83,7 @@ async def handle_a2a_request(request: Request):
     """Handle A2A JSON-RPC requests."""
     body = None
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
         method = body.get("method", "")
         params = body.get("params", {})
         request_id = body.get("id", "1")
@@ -82,8 +98,11 @@ async def handle_a2a_request(request: Request):
 
             if not query:
                 logger.warning(f"Request {request_id}: Missing query text in params")
-                return JSONResponse(
-                    create_a2a_error(-32602, "Invalid params: missing query text", request_id)
+                return Response(
+                    create_a2a_error_bytes(
+                        INVALID_PARAMS, "Invalid params: missing query text", request_id
+                    ),
+                    media_type="application/json",
                 )
 
             logger.info(f"Processing query: {query[:100]}...")
@@ -98,7 +117,7 @@ async def handle_a2a_request(request: Request):
 
             logger.info(f"Request {request_id}: Completed successfully")
 
-            return JSONResponse(
+            return ORJSONResponse(
                 create_a2a_response(
                     {
                         "message": {
@@ -112,24 +131,25 @@ async def handle_a2a_request(request: Request):
 
         else:
             logger.warning(f"Request {request_id}: Unknown method '{method}'")
-            return JSONResponse(create_a2a_error(-32601, f"Method not found: {method}", request_id))
+            return Response(
+                create_a2a_error_bytes(METHOD_NOT_FOUND, f"Method not found: {method}", request_id),
+                media_type="application/json",
+            )
 
     except Exception as e:
         request_id = body.get("id", "1") if body else "1"
         error_msg = f"Internal error: {str(e)}"
         logger.error(f"Request {request_id}: {error_msg}", exc_info=True)
-        return JSONResponse(create_a2a_error(-32603, error_msg, request_id))
+        return Response(
+            create_a2a_error_bytes(INTERNAL_ERROR, error_msg, request_id),
+            media_type="application/json",
+        )
 
 
 def main():
     """Run the A2A server."""
     logger.info(f"Starting Knowledge Agent on {settings.host}:{settings.port}")
-    uvicorn.run(
-        "agents.knowledge.a2a_server:app",
-        host=settings.host,
-        port=settings.port,
-        reload=False,
-    )
+    run_a2a_server("agents.knowledge.a2a_server:app", settings)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,5 @@
 """Knowledge Manager Agent configuration."""
 
-import sys
-from functools import lru_cache
-
-sys.path.insert(0, "/app")
-
 from shared.config import Settings
 
 
@@ -14,7 +9,6 @@ class KnowledgeSettings(Settings):
     port: int = 8003
     agent_name: str = "knowledge-agent"
     agent_description: str = "Persistent memory and RAG for the multi-agent system"
-    azure_openai_deployment: str = "gpt-4o"
 
     # Knowledge-specific settings
     vector_db_path: str = "./data/knowledge.lance"
@@ -22,7 +16,12 @@ class KnowledgeSettings(Settings):
     max_search_results: int = 5
 
 
-@lru_cache
+_SETTINGS: KnowledgeSettings | None = None
+
+
 def get_settings() -> KnowledgeSettings:
     """Get cached knowledge settings."""
-    return KnowledgeSettings()
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = KnowledgeSettings()
+    return _SETTINGS
@@ -1,26 +1,33 @@
 """A2A Server for the Orchestrator agent."""
 
-import sys
-
-import uvicorn
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import StreamingResponse
+
+from shared.a2a_utils import (
+    INTERNAL_ERROR,
+    INVALID_PARAMS,
+    METHOD_NOT_FOUND,
+    close_a2a_clients,
+    create_a2a_error_bytes,
+    create_a2a_response,
+    create_agent_card_bytes,
+)
+from shared.logging_config import setup_logging
+from shared.models import close_http_clients as close_model_clients
+from shared.server import ORJSONResponse, run_a2a_server
+from shared.token_manager import TokenManager
 
 from .config import get_settings
 from .orchestrator import OrchestratorAgent
 from .streaming import StreamingOrchestrator
 
-sys.path.insert(0, "/app")
-from shared.a2a_utils import create_a2a_error, create_a2a_response, create_agent_card
-from shared.logging_config import setup_logging
-from shared.token_manager import TokenManager
-
 # Set up logging first
 settings = get_settings()
 logger = setup_logging("orchestrator-agent", level="INFO")
 
-app = FastAPI(title="Orchestrator Agent", version="1.0.0")
+app = FastAPI(title="Orchestrator Agent", version="1.0.0", default_response_class=ORJSONResponse)
 
 # Add CORS for frontend
 app.add_middleware(
@@ -40,27 +47,37 @@ streaming_orchestrator = StreamingOrchestrator()
 logger.info("Orchestrator Agent initialized successfully")
 
 
+@app.on_event("shutdown")
+async def close_agent_clients():
+    """Close pooled connections to the other agents and Azure OpenAI."""
+    await close_a2a_clients()
+    await close_model_clients()
+
+
+# The agent card never changes, so serialize it once at startup
+app.state.agent_card_bytes = create_agent_card_bytes(
+    name=settings.agent_name,
+    description=settings.agent_description,
+    url=f"http://localhost:{settings.port}",
+    skills=[
+        {
+            "id": "route-query",
+            "name": "Route Query",
+            "description": "Analyzes user queries and routes to appropriate agents",
+        },
+        {
+            "id": "synthesize-response",
+            "name": "Synthesize Response",
+            "description": "Combines responses from multiple agents into coherent answer",
+        },
+    ],
+)
+
+
 @app.get("/.well-known/agent.json")
 async def get_agent_card():
     """Return the A2A Agent Card for discovery."""
-    card = create_agent_card(
-        name=settings.agent_name,
-        description=settings.agent_description,
-        url=f"http://localhost:{settings.port}",
-        skills=[
-            {
-                "id": "route-query",
-                "name": "Route Query",
-                "description": "Analyzes user queries and routes to appropriate agents",
-            },
-            {
-                "id": "synthesize-response",
-                "name": "Synthesize Response",
-                "description": "Combines responses from multiple agents into coherent answer",
-            },
-        ],
-    )
-    return card.model_dump()
+    return Response(content=app.state.agent_card_bytes, media_type="application/json")
 
 
 @app.get("/health")
@@ -74,7 +91,7 @@ async def handle_a2a_request(request: Request):
     """Handle A2A JSON-RPC requests."""
     body = None
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
         method = body.get("method", "")
         params = body.get("params", {})
         request_id = body.get("id", "1")
@@ -89,8 +106,11 @@ async def handle_a2a_request(request: Request):
 
             if not query:
                 logger.warning(f"Request {request_id}: Missing query text in params")
-                return JSONResponse(
-                    create_a2a_error(-32602, "Invalid params: missing query text", request_id)
+                return Response(
+                    create_a2a_error_bytes(
+                        INVALID_PARAMS, "Invalid params: missing query text", request_id
+                    ),
+                    media_type="application/json",
                 )
 
             logger.info(f"Processing query: {query[:100]}...")
@@ -103,7 +123,7 @@ async def handle_a2a_request(request: Request):
                 f"Request {request_id}: Completed successfully, used agents: {result.agents_used}"
             )
 
-            return JSONResponse(
+            return ORJSONResponse(
                 create_a2a_response(
                     {
                         "message": {
@@ -123,26 +143,32 @@ async def handle_a2a_request(request: Request):
             # Return task status (simplified)
             task_id = params.get("id", "")
             logger.debug(f"Request {request_id}: Getting task status for {task_id}")
-            return JSONResponse(
+            return ORJSONResponse(
                 create_a2a_response({"status": "completed", "task_id": task_id}, request_id)
             )
 
         else:
             logger.warning(f"Request {request_id}: Unknown method '{method}'")
-            return JSONResponse(create_a2a_error(-32601, f"Method not found: {method}", request_id))
+            return Response(
+                create_a2a_error_bytes(METHOD_NOT_FOUND, f"Method not found: {method}", request_id),
+                media_type="application/json",
+            )
 
     except Exception as e:
         request_id = body.get("id", "1") if body else "1"
         error_msg = f"Internal error: {str(e)}"
         logger.error(f"Request {request_id}: {error_msg}", exc_info=True)
-        return JSONResponse(create_a2a_error(-32603, error_msg, request_id))
+        return Response(
+            create_a2a_error_bytes(INTERNAL_ERROR, error_msg, request_id),
+            media_type="application/json",
+        )
 
 
 @app.post("/stream")
 async def stream_a2a_request(request: Request):
     """Stream A2A responses via Server-Sent Events (SSE)."""
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
         query = ""
 
         # Support both direct query and A2A format
@@ -154,7 +180,7 @@ async def stream_a2a_request(request: Request):
             query = parts[0].get("text", "") if parts else ""
 
         if not query:
-            return JSONResponse({"error": "Missing query"}, status_code=400)
+            return ORJSONResponse({"error": "Missing query"}, status_code=400)
 
         logger.info(f"Starting SSE stream for query: {query[:100]}...")
 
@@ -169,18 +195,13 @@ async def stream_a2a_request(request: Request):
         )
     except Exception as e:
         logger.error(f"Stream error: {e}", exc_info=True)
-        return JSONResponse({"error": str(e)}, status_code=500)
+        return ORJSONResponse({"error": str(e)}, status_code=500)
 
 
 def main():
     """Run the A2A server."""
     logger.info(f"Starting Orchestrator Agent on {settings.host}:{settings.port}")
-    uvicorn.run(
-        "agents.orchestrator.a2a_server:app",
-        host=settings.host,
-        port=settings.port,
-        reload=False,
-    )
+    run_a2a_server("agents.orchestrator.a2a_server:app", settings)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,5 @@
 """Orchestrator configuration."""
 
-import sys
-from functools import lru_cache
-
-sys.path.insert(0, "/app")
-
 from shared.config import Settings
 
 
@@ -14,10 +9,14 @@ class OrchestratorSettings(Settings):
     port: int = 8000
     agent_name: str = "orchestrator-agent"
     agent_description: str = "Main orchestrator for multi-agent AI system"
-    azure_openai_deployment: str = "gpt-4o"
 
 
-@lru_cache
+_SETTINGS: OrchestratorSettings | None = None
+
+
 def get_settings() -> OrchestratorSettings:
     """Get cached orchestrator settings."""
-    return OrchestratorSettings()
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = OrchestratorSettings()
+    return _SETTINGS
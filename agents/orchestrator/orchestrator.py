@@ -1,18 +1,17 @@
 """LangGraph-based orchestrator agent."""
 
 import logging
-import sys
 from typing import Literal, TypedDict
 
 from langgraph.graph import END, StateGraph
 
+from shared.a2a_utils import get_a2a_client
+from shared.config import AgentEndpoints
+
 from .config import get_settings
 from .router import AgentType, QueryRouter, RoutingDecision
 from .synthesizer import AgentResponse, ResponseSynthesizer, SynthesizedResponse
 
-sys.path.insert(0, "/app")
-from shared.a2a_utils import A2AClient
-
 # Set up module logger
 logger = logging.getLogger("orchestrator-agent")
 
@@ -36,6 +35,7 @@ class OrchestratorAgent:
     def __init__(self):
         logger.info("Initializing OrchestratorAgent...")
         self.settings = get_settings()
+        self.endpoints = AgentEndpoints.from_settings(self.settings)
         self.router = QueryRouter(settings=self.settings)
         self.synthesizer = ResponseSynthesizer(settings=self.settings)
         self.graph = self._build_graph()
@@ -115,7 +115,7 @@ class OrchestratorAgent:
         """Check the knowledge base for existing information."""
         logger.debug("Checking knowledge base...")
         try:
-            async with A2AClient(self.settings.knowledge_agent_url) as client:
+            async with get_a2a_client(self.endpoints.knowledge) as client:
                 result = await client.send_task(
                     f"Search for relevant information about: {state['query']}"
                 )
@@ -146,7 +146,7 @@ class OrchestratorAgent:
 
         logger.info("Calling research agent...")
         try:
-            async with A2AClient(self.settings.research_agent_url) as client:
+            async with get_a2a_client(self.endpoints.research) as client:
                 result = await client.send_task(state["query"])
                 content = self._extract_content(result)
                 logger.info(f"Research agent returned {len(content)} chars")
@@ -185,7 +185,7 @@ class OrchestratorAgent:
             context = state.get("research_result", "")
             query = f"{state['query']}\n\nContext from research:\n{context}"
 
-            async with A2AClient(self.settings.explainer_agent_url) as client:
+            async with get_a2a_client(self.endpoints.explainer) as client:
                 result = await client.send_task(query)
                 content = self._extract_content(result)
                 logger.info(f"Explainer agent returned {len(content)} chars")
@@ -225,7 +225,7 @@ class OrchestratorAgent:
 
         # Store the result in knowledge base for future queries
         try:
-            async with A2AClient(self.settings.knowledge_agent_url) as client:
+            async with get_a2a_client(self.endpoints.knowledge) as client:
                 await client.send_task(
                     f"Store this research finding:\nQuery: {state['query']}\nAnswer: {final.answer}"
                 )
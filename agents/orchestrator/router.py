@@ -1,13 +1,20 @@
 """Query router for determining which agents to call."""
 
+from __future__ import annotations
+
 import json
 from enum import Enum
+from typing import TYPE_CHECKING
 
 from pydantic import BaseModel
 
-from shared.config import Settings
 from shared.models import ModelFactory
 
+if TYPE_CHECKING:
+    from openai import AsyncAzureOpenAI
+
+    from shared.config import Settings
+
 
 class AgentType(str, Enum):
     """Available agent types."""
@@ -64,13 +71,13 @@ class QueryRouter:
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.model = ModelFactory.create_genai_model(settings)
+        self.model: AsyncAzureOpenAI = ModelFactory.create_async_genai_model(settings)
 
     async def route(self, query: str) -> RoutingDecision:
         """Determine which agents should handle the query."""
         prompt = ROUTING_PROMPT.format(query=query)
 
-        response = self.model.chat.completions.create(
+        response = await self.model.chat.completions.create(
             model=self.settings.azure_openai_deployment,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.1,
@@ -2,17 +2,16 @@
 
 import json
 import logging
-import sys
 import time
 from collections.abc import AsyncGenerator
 
+from shared.a2a_utils import get_a2a_client
+from shared.config import AgentEndpoints
+
 from .config import get_settings
 from .router import AgentType, QueryRouter
 from .synthesizer import AgentResponse, ResponseSynthesizer
 
-sys.path.insert(0, "/app")
-from shared.a2a_utils import A2AClient
-
 logger = logging.getLogger("orchestrator-agent")
 
 
@@ -21,6 +20,7 @@ class StreamingOrchestrator:
 
     def __init__(self):
         self.settings = get_settings()
+        self.endpoints = AgentEndpoints.from_settings(self.settings)
         self.router = QueryRouter(settings=self.settings)
         self.synthesizer = ResponseSynthesizer(settings=self.settings)
 
@@ -51,6 +51,8 @@ class StreamingOrchestrator:
                 },
             )
 
+            # Responses are built from events this class emitted itself, so
+            # model_construct skips re-validating trusted data.
             agent_responses: list[AgentResponse] = []
 
             # === 2. Knowledge Agent (if needed) ===
@@ -63,9 +65,11 @@ class StreamingOrchestrator:
                             data = json.loads(event.split("data: ")[1])
                             if data.get("payload", {}).get("content"):
                                 agent_responses.append(
-                                    AgentResponse(
+                                    AgentResponse.model_construct(
                                         agent_name="knowledge",
                                         content=data["payload"]["content"],
+                                        success=True,
+                                        error=None,
                                     )
                                 )
                         except (json.JSONDecodeError, KeyError, IndexError):
@@ -80,9 +84,11 @@ class StreamingOrchestrator:
                             data = json.loads(event.split("data: ")[1])
                             if data.get("payload", {}).get("content"):
                                 agent_responses.append(
-                                    AgentResponse(
+                                    AgentResponse.model_construct(
                                         agent_name="research",
                                         content=data["payload"]["content"],
+                                        success=True,
+                                        error=None,
                                     )
                                 )
                         except (json.JSONDecodeError, KeyError, IndexError):
@@ -100,9 +106,11 @@ class StreamingOrchestrator:
                             data = json.loads(event.split("data: ")[1])
                             if data.get("payload", {}).get("content"):
                                 agent_responses.append(
-                                    AgentResponse(
+                                    AgentResponse.model_construct(
                                         agent_name="explainer",
                                         content=data["payload"]["content"],
+                                        success=True,
+                                        error=None,
                                     )
                                 )
                         except (json.JSONDecodeError, KeyError, IndexError):
@@ -184,7 +192,7 @@ class StreamingOrchestrator:
 
         start_time = time.time()
         try:
-            async with A2AClient(self.settings.knowledge_agent_url) as client:
+            async with get_a2a_client(self.endpoints.knowledge) as client:
                 result = await client.send_task(f"Search for relevant information about: {query}")
                 content = self._extract_content(result)
 
@@ -238,7 +246,7 @@ class StreamingOrchestrator:
 
         start_time = time.time()
         try:
-            async with A2AClient(self.settings.research_agent_url) as client:
+            async with get_a2a_client(self.endpoints.research) as client:
                 result = await client.send_task(query)
                 content = self._extract_content(result)
 
@@ -298,7 +306,7 @@ class StreamingOrchestrator:
         start_time = time.time()
         try:
             full_query = f"{query}\n\nContext from research:\n{context}"
-            async with A2AClient(self.settings.explainer_agent_url) as client:
+            async with get_a2a_client(self.endpoints.explainer) as client:
                 result = await client.send_task(full_query)
                 content = self._extract_content(result)
 
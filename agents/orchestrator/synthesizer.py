@@ -1,10 +1,18 @@
 """Response synthesizer for combining agent outputs."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from pydantic import BaseModel
 
-from shared.config import Settings
 from shared.models import ModelFactory
 
+if TYPE_CHECKING:
+    from openai import AsyncAzureOpenAI
+
+    from shared.config import Settings
+
 
 class AgentResponse(BaseModel):
     """Response from an individual agent."""
@@ -45,7 +53,7 @@ class ResponseSynthesizer:
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.model = ModelFactory.create_genai_model(settings)
+        self.model: AsyncAzureOpenAI = ModelFactory.create_async_genai_model(settings)
 
     async def synthesize(
         self,
@@ -76,7 +84,7 @@ class ResponseSynthesizer:
             agent_responses=formatted_responses,
         )
 
-        response = self.model.chat.completions.create(
+        response = await self.model.chat.completions.create(
             model=self.settings.azure_openai_deployment,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.3,
@@ -1,19 +1,68 @@
 """CrewAI-based Research Agent for AI project discovery."""
 
+import asyncio
 import logging
+from functools import cached_property
+from typing import Any
 
 from crewai import Agent, Crew, Process, Task
 
 from shared.models import ModelFactory
+from shared.token_manager import TokenManager
 
+from .cache import ResearchCache
 from .config import get_settings
 from .tools import FirecrawlSearchTool, GitHubSearchTool
-from .tools.firecrawl import FirecrawlScrapeTool
-from .tools.github import GitHubRepoDetailsTool
+from .tools.firecrawl import FirecrawlBatchScrapeTool, FirecrawlScrapeTool
+from .tools.github import GitHubRepoDetailsBatchTool, GitHubRepoDetailsTool
 
 # Set up module logger
 logger = logging.getLogger("research-agent")
 
+# Task prompts keep the static instructions first and the query last, so the
+# prompt prefix is identical across requests and eligible for prompt caching.
+_WEB_TASK_TEMPLATE = """Search the web for information about the research topic below.
+
+Focus on:
+1. Recent news and announcements
+2. Technical documentation and tutorials
+3. Comparisons and reviews
+
+Use the firecrawl_search tool to find relevant content, then read the
+most relevant pages in one call with firecrawl_batch_scrape.
+
+Research topic: {query}"""
+
+_GITHUB_TASK_TEMPLATE = """Search GitHub for repositories related to the research topic below.
+
+Focus on:
+1. Most starred repositories
+2. Recently updated projects
+3. Active communities
+
+Use the github_search tool, then get details for the top projects
+in one call with github_repo_details_batch.
+
+Research topic: {query}"""
+
+_SYNTHESIS_TASK_TEMPLATE = """Combine the web and GitHub findings into a comprehensive report.
+
+Include:
+1. Overview of the topic/technology
+2. Top repositories and their features
+3. Recent developments and trends
+4. Recommendations for getting started
+
+Format the output clearly with headers and bullet points.
+
+Research topic: {query}
+
+Web research findings:
+{web_findings}
+
+GitHub findings:
+{github_findings}"""
+
 
 class ResearchAgent:
     """Research agent using CrewAI for AI project discovery."""
@@ -23,44 +72,104 @@ class ResearchAgent:
 
         logger.info("Initializing ResearchAgent tools...")
 
-        # Initialize tools
-        self.firecrawl_search = FirecrawlSearchTool(api_key=self.settings.firecrawl_api_key)
-        self.firecrawl_scrape = FirecrawlScrapeTool(api_key=self.settings.firecrawl_api_key)
+        # GitHub tools are cheap and quick_search needs them; the Firecrawl
+        # tools and the LLM are only built when research() first needs them
         self.github_search = GitHubSearchTool(token=self.settings.github_token)
-        self.github_details = GitHubRepoDetailsTool(token=self.settings.github_token)
+        self.github_details = GitHubRepoDetailsTool(
+            token=self.settings.github_token, cache_dir=self.settings.cache_dir
+        )
+        self.github_details_batch = GitHubRepoDetailsBatchTool(
+            token=self.settings.github_token, cache_dir=self.settings.cache_dir
+        )
 
-        # Create provider-agnostic LLM for CrewAI
-        logger.info("Creating CrewAI LLM...")
-        self.llm = ModelFactory.create_crewai_llm(self.settings)
+        # CrewAI's Azure provider reads the token once, at construction
+        self._llm: Any = None
+        self._llm_token: str | None = None
+
+        # Caps crews running at once across requests (LLM rate limits)
+        self._crew_semaphore = asyncio.Semaphore(self.settings.max_concurrent_crews)
+        self.cache = ResearchCache(self.settings)
         logger.info("ResearchAgent initialization complete")
 
-    def _create_research_crew(self, query: str) -> Crew:
-        """Create a crew with tasks for a specific research query."""
-        # Web Research Agent
+    @property
+    def llm(self) -> Any:
+        """Provider-agnostic CrewAI LLM, created on first use."""
+        if self._llm is None:
+            self._build_llm()
+        return self._llm
+
+    def _build_llm(self) -> None:
+        """Create the CrewAI LLM and record the token it was built with."""
+        logger.info("Creating CrewAI LLM...")
+        self._llm = ModelFactory.create_crewai_llm(self.settings)
+        self._llm_token = TokenManager.get_instance().get_token()
+
+    @cached_property
+    def firecrawl_search(self) -> FirecrawlSearchTool:
+        return FirecrawlSearchTool(api_key=self.settings.firecrawl_api_key)
+
+    @cached_property
+    def firecrawl_scrape(self) -> FirecrawlScrapeTool:
+        return FirecrawlScrapeTool(api_key=self.settings.firecrawl_api_key)
+
+    @cached_property
+    def firecrawl_batch_scrape(self) -> FirecrawlBatchScrapeTool:
+        return FirecrawlBatchScrapeTool(api_key=self.settings.firecrawl_api_key)
+
+    def _create_web_crew(self, query: str) -> Crew:
+        """Create a single-task crew that researches the query on the web."""
         web_researcher = Agent(
             role="AI Web Researcher",
             goal="Find the latest information about AI projects and frameworks on the web",
             backstory="""You are an expert at finding and analyzing AI/ML content on the web.
             You use Firecrawl to search and scrape websites for the most relevant information
             about AI frameworks, tools, and projects.""",
-            tools=[self.firecrawl_search, self.firecrawl_scrape],
+            tools=[self.firecrawl_search, self.firecrawl_scrape, self.firecrawl_batch_scrape],
             verbose=True,
             llm=self.llm,
         )
 
-        # GitHub Research Agent
+        web_research_task = Task(
+            description=_WEB_TASK_TEMPLATE.format(query=query),
+            expected_output="A summary of web research findings with sources",
+            agent=web_researcher,
+        )
+
+        return Crew(
+            agents=[web_researcher],
+            tasks=[web_research_task],
+            process=Process.sequential,
+            verbose=True,
+        )
+
+    def _create_github_crew(self, query: str) -> Crew:
+        """Create a single-task crew that researches the query on GitHub."""
         github_researcher = Agent(
             role="GitHub AI Project Analyst",
             goal="Find and analyze popular AI/ML open source projects on GitHub",
             backstory="""You are an expert at discovering and evaluating open source AI projects
             on GitHub. You analyze repository metrics, documentation, and activity to identify
             the most promising and popular projects.""",
-            tools=[self.github_search, self.github_details],
+            tools=[self.github_search, self.github_details, self.github_details_batch],
             verbose=True,
             llm=self.llm,
         )
 
-        # Research Synthesizer Agent
+        github_research_task = Task(
+            description=_GITHUB_TASK_TEMPLATE.format(query=query),
+            expected_output="A list of relevant GitHub repositories with descriptions and metrics",
+            agent=github_researcher,
+        )
+
+        return Crew(
+            agents=[github_researcher],
+            tasks=[github_research_task],
+            process=Process.sequential,
+            verbose=True,
+        )
+
+    def _create_synthesis_crew(self, query: str, web_findings: str, github_findings: str) -> Crew:
+        """Create a crew that combines the web and GitHub findings into a report."""
         synthesizer = Agent(
             role="Research Synthesizer",
             goal="Combine web and GitHub research into comprehensive reports",
@@ -71,77 +180,95 @@ class ResearchAgent:
             llm=self.llm,
         )
 
-        # Define tasks
-        web_research_task = Task(
-            description=f"""Search the web for information about: {query}
-            
-            Focus on:
-            1. Recent news and announcements
-            2. Technical documentation and tutorials
-            3. Comparisons and reviews
-            
-            Use the firecrawl_search tool to find relevant content.""",
-            expected_output="A summary of web research findings with sources",
-            agent=web_researcher,
-        )
-
-        github_research_task = Task(
-            description=f"""Search GitHub for repositories related to: {query}
-            
-            Focus on:
-            1. Most starred repositories
-            2. Recently updated projects
-            3. Active communities
-            
-            Use the github_search tool and get details for top projects.""",
-            expected_output="A list of relevant GitHub repositories with descriptions and metrics",
-            agent=github_researcher,
-        )
-
         synthesis_task = Task(
-            description="""Combine the web research and GitHub findings into a comprehensive report.
-            
-            Include:
-            1. Overview of the topic/technology
-            2. Top repositories and their features
-            3. Recent developments and trends
-            4. Recommendations for getting started
-            
-            Format the output clearly with headers and bullet points.""",
+            description=_SYNTHESIS_TASK_TEMPLATE.format(
+                query=query, web_findings=web_findings, github_findings=github_findings
+            ),
             expected_output="A comprehensive research report",
             agent=synthesizer,
-            context=[web_research_task, github_research_task],
         )
 
         return Crew(
-            agents=[web_researcher, github_researcher, synthesizer],
-            tasks=[web_research_task, github_research_task, synthesis_task],
+            agents=[synthesizer],
+            tasks=[synthesis_task],
             process=Process.sequential,
             verbose=True,
         )
 
+    async def _ensure_llm(self) -> None:
+        """Build the LLM, or rebuild it if the Azure AD token has been refreshed.
+
+        The token is only re-acquired when it is close to expiry, and that
+        happens off the event loop. Building the LLM makes no network call.
+        """
+        token = await TokenManager.get_instance().ensure_fresh()
+        if self._llm is None or token != self._llm_token:
+            if self._llm is not None:
+                logger.info("Azure AD token refreshed, rebuilding CrewAI LLM")
+            self._build_llm()
+
+    async def _kickoff(self, crew: Crew) -> str:
+        """Run a crew off the event loop, bounded by the crew semaphore."""
+        async with self._crew_semaphore:
+            result = await crew.kickoff_async()
+        return str(result)
+
     async def research(self, query: str) -> str:
-        """Execute research on the given query."""
+        """Execute research on the given query.
+
+        Web and GitHub research have no dependency on each other, so their
+        crews run concurrently and only the synthesis step waits for both.
+        Reports for identical or near-identical queries are served from the
+        cache without running any crew.
+        """
         logger.info(f"Starting research for query: {query[:100]}...")
 
-        # Execute the crew
+        cached = await self.cache.get(query)
+        if cached is not None:
+            logger.info(f"Serving research from cache (stats: {self.cache.stats})")
+            return cached
+
         try:
-            logger.info("Executing crew research workflow...")
-            # Create a new crew with tasks for this specific query
-            crew = self._create_research_crew(query)
-            result = crew.kickoff()
+            await self._ensure_llm()
+
+            logger.info("Executing web and GitHub research crews...")
+            web_findings, github_findings = await asyncio.gather(
+                self._kickoff(self._create_web_crew(query)),
+                self._kickoff(self._create_github_crew(query)),
+            )
+
+            logger.info("Synthesizing research findings...")
+            result = await self._kickoff(
+                self._create_synthesis_crew(query, web_findings, github_findings)
+            )
             logger.info("Research completed successfully")
-            return str(result)
+            await self.cache.set(query, result)
+            return result
         except Exception as e:
             error_msg = f"Research failed: {str(e)}"
             logger.error(error_msg, exc_info=True)
             return error_msg
 
+    async def warmup(self) -> None:
+        """Open the connection to the LLM deployment before the first request.
+
+        The CrewAI LLM keeps its HTTP client for the life of the process, so a
+        trivial completion here moves the TCP/TLS handshake and the
+        deployment's cold start off the first real research request.
+        """
+        logger.info("Warming up LLM connection...")
+        try:
+            await self._ensure_llm()
+            await asyncio.to_thread(self.llm.call, "Reply with OK.")
+            logger.info("LLM warm-up completed")
+        except Exception as e:
+            logger.warning(f"LLM warm-up failed: {str(e)}")
+
     async def quick_search(self, query: str) -> str:
         """Execute a quick GitHub-only search."""
         logger.info(f"Starting quick search for query: {query[:100]}...")
         try:
-            result = self.github_search._run(query)
+            result = await self.github_search._arun(query)
             logger.info("Quick search completed successfully")
             return result
         except Exception as e:
@@ -0,0 +1,261 @@
+"""Caches for research reports and tool results.
+
+``ResearchCache`` is a two-tier cache for research reports. The exact tier
+matches a normalized query by SHA-256. On a miss, the semantic tier embeds
+the query with the Azure OpenAI embedding deployment and returns the
+closest cached report if its cosine similarity clears the configured
+threshold, so near-duplicate questions skip the crews entirely.
+Embeddings are stored as 32-bit float arrays and compared in a worker
+thread, so a full scan neither bloats memory nor blocks the event loop.
+
+``TTLCache`` is a small thread-safe LRU used by the tools, which CrewAI
+calls from worker threads. ``DiskCache`` persists tool results across
+restarts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+import operator
+import os
+import shelve
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from shared.models import ModelFactory
+
+if TYPE_CHECKING:
+    from .config import ResearchSettings
+
+logger = logging.getLogger("research-agent")
+
+
+@dataclass
+class CachedReport:
+    """A cached research report with its expiry and query embedding."""
+
+    report: str
+    expires_at: float  # Unix timestamp
+    embedding: array | None = None  # unit length, 32-bit floats
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries go stale after a fixed TTL.
+
+    Stale entries are kept until evicted so callers can revalidate them
+    (e.g. with an ETag) and ``touch`` them instead of refetching.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the value for a key if it is present and fresh."""
+        entry = self.get_entry(key)
+        if entry is None or not entry[1]:
+            return None
+        return entry[0]
+
+    def get_entry(self, key: Hashable) -> tuple[Any, bool] | None:
+        """Return ``(value, is_fresh)`` for a key, including stale entries."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            value, expires_at = entry
+            return value, time.time() < expires_at
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (value, time.time() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def touch(self, key: Hashable) -> None:
+        """Mark an existing entry fresh for another TTL period."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (entry[0], time.time() + self.ttl)
+
+
+class DiskCache:
+    """Thread-safe persistent key-value store backed by ``shelve``.
+
+    The shelf is opened on first use. Storage errors are logged and treated
+    as cache misses so a broken cache never fails a tool call.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self._shelf: shelve.Shelf | None = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> shelve.Shelf:
+        if self._shelf is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._shelf = shelve.open(self.path)
+        return self._shelf
+
+    def get(self, key: str) -> Any | None:
+        """Return the stored value for a key, or None."""
+        with self._lock:
+            try:
+                return self._open().get(key)
+            except Exception as e:
+                logger.warning(f"Disk cache read failed for {self.path}: {str(e)}")
+                return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value for a key."""
+        with self._lock:
+            try:
+                self._open()[key] = value
+            except Exception as e:
+                logger.warning(f"Disk cache write failed for {self.path}: {str(e)}")
+
+    def close(self) -> None:
+        """Flush and close the shelf."""
+        with self._lock:
+            if self._shelf is not None:
+                self._shelf.close()
+                self._shelf = None
+
+
+def _normalize(vector: list[float]) -> array:
+    """Scale a vector to unit length so cosine similarity is a dot product."""
+    norm = math.sqrt(sum(x * x for x in vector))
+    return array("f", (x / norm for x in vector) if norm else vector)
+
+
+def _best_match(embedding: array, candidates: list[tuple[str, array]]) -> tuple[str | None, float]:
+    """Find the candidate with the highest dot product against an embedding."""
+    best_key, best_score = None, -1.0
+    for key, other in candidates:
+        score = sum(map(operator.mul, embedding, other))
+        if score > best_score:
+            best_key, best_score = key, score
+    return best_key, best_score
+
+
+class ResearchCache:
+    """In-process LRU cache of research reports with TTL and semantic lookup."""
+
+    def __init__(self, settings: ResearchSettings):
+        self.settings = settings
+        self.ttl = settings.cache_ttl_seconds
+        self.max_entries = settings.cache_max_entries
+        self.similarity_threshold = settings.semantic_cache_threshold
+        self.semantic_enabled = settings.semantic_cache_enabled
+
+        self._entries: OrderedDict[str, CachedReport] = OrderedDict()
+        # Embeddings computed on a miss, kept so set() does not embed twice
+        self._pending_embeddings: OrderedDict[str, array] = OrderedDict()
+        self._embedding_client: Any = None
+        self.stats = {"hits": 0, "semantic_hits": 0, "misses": 0}
+
+    @staticmethod
+    def cache_key(query: str) -> str:
+        """Hash a query after normalizing case and whitespace."""
+        normalized = " ".join(query.lower().split())
+        return hashlib.sha256(normalized.encode()).hexdigest()
+
+    async def get(self, query: str) -> str | None:
+        """Return a cached report for the query or a semantically similar one."""
+        now = time.time()
+        self._evict_expired(now)
+
+        key = self.cache_key(query)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry.report
+
+        if self.semantic_enabled and self._entries:
+            embedding = await self._embed(query)
+            if embedding is not None:
+                self._remember_embedding(key, embedding)
+                best_key, best_score = await self._most_similar(embedding)
+                # The entry may have been replaced or evicted during the scan
+                match = self._entries.get(best_key) if best_key is not None else None
+                if match is not None and best_score >= self.similarity_threshold:
+                    logger.info(f"Semantic cache hit (similarity {best_score:.3f})")
+                    self._entries.move_to_end(best_key)
+                    self.stats["semantic_hits"] += 1
+                    return match.report
+
+        self.stats["misses"] += 1
+        return None
+
+    async def set(self, query: str, report: str) -> None:
+        """Cache a report for the query."""
+        key = self.cache_key(query)
+        embedding = self._pending_embeddings.pop(key, None)
+        if embedding is None and self.semantic_enabled:
+            embedding = await self._embed(query)
+
+        self._entries[key] = CachedReport(
+            report=report,
+            expires_at=time.time() + self.ttl,
+            embedding=embedding,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop entries whose TTL has passed."""
+        expired = [k for k, e in self._entries.items() if e.expires_at <= now]
+        for k in expired:
+            del self._entries[k]
+
+    async def _most_similar(self, embedding: array) -> tuple[str | None, float]:
+        """Find the cached entry whose query embedding is closest.
+
+        Scores a snapshot of the entries in a worker thread, so a scan over
+        a full cache does not block the event loop.
+        """
+        candidates = [
+            (k, entry.embedding)
+            for k, entry in self._entries.items()
+            if entry.embedding is not None
+        ]
+        if not candidates:
+            return None, -1.0
+        return await asyncio.to_thread(_best_match, embedding, candidates)
+
+    def _remember_embedding(self, key: str, embedding: array) -> None:
+        """Keep a bounded number of embeddings from recent misses."""
+        self._pending_embeddings[key] = embedding
+        while len(self._pending_embeddings) > self.max_entries:
+            self._pending_embeddings.popitem(last=False)
+
+    async def _embed(self, query: str) -> array | None:
+        """Embed a query, returning None if the embedding call fails."""
+        try:
+            if self._embedding_client is None:
+                self._embedding_client = ModelFactory.create_embedding_client(self.settings)
+            response = await asyncio.to_thread(
+                self._embedding_client.embeddings.create,
+                model=self.settings.azure_openai_embedding_deployment,
+                input=query,
+            )
+            return _normalize(response.data[0].embedding)
+        except Exception as e:
+            logger.warning(f"Query embedding failed, using exact cache only: {str(e)}")
+            return None
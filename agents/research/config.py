@@ -1,10 +1,5 @@
 """Research Agent configuration."""
 
-import sys
-from functools import lru_cache
-
-sys.path.insert(0, "/app")
-
 from shared.config import Settings
 
 
@@ -14,15 +9,34 @@ class ResearchSettings(Settings):
     port: int = 8001
     agent_name: str = "research-agent"
     agent_description: str = "Researches AI projects with Firecrawl and GitHub MCP"
-    azure_openai_deployment: str = "gpt-4o"
 
     # Research-specific settings
     firecrawl_api_key: str
     github_token: str = ""
     max_results: int = 10
+    max_concurrent_crews: int = 2
+    # Threads for blocking Firecrawl SDK calls
+    firecrawl_pool_workers: int = 4
+
+    # Research report cache (exact match, then embedding similarity)
+    cache_ttl_seconds: int = 3600
+    cache_max_entries: int = 256
+    semantic_cache_enabled: bool = True
+    semantic_cache_threshold: float = 0.92
+
+    # Persistent tool cache directory; empty disables it
+    cache_dir: str = "~/.cache/research-agent"
+
+    # Send a trivial prompt to the LLM deployment at startup
+    warmup_on_startup: bool = False
+
+
+_SETTINGS: ResearchSettings | None = None
 
 
-@lru_cache
 def get_settings() -> ResearchSettings:
     """Get cached research settings."""
-    return ResearchSettings()
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = ResearchSettings()
+    return _SETTINGS
@@ -1,9 +1,109 @@
 """Firecrawl web search tool for researching AI projects."""
 
+import asyncio
+import hashlib
+import json
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, TypeVar
+
 from crewai.tools import BaseTool
 from firecrawl import FirecrawlApp
 from pydantic import BaseModel
 
+from ..cache import TTLCache
+from ..config import get_settings
+
+# Formatted search results keyed by a hash of the request parameters
+_search_cache = TTLCache(maxsize=256, ttl=600)
+
+# Scrapes in flight for one batch; Firecrawl rate-limits per API key
+MAX_CONCURRENT_SCRAPES = 3
+
+# Page content passed to the LLM is capped at this many characters
+MAX_SCRAPE_CHARS = 5000
+
+# Main content only (no nav/footer boilerplate), served from Firecrawl's
+# cache when it has a copy newer than max_age (milliseconds)
+_SCRAPE_OPTIONS = {"formats": ["markdown"], "only_main_content": True, "max_age": 3_600_000}
+
+
+# Blocking SDK calls run on their own pool, sized to Firecrawl's concurrency
+# budget, so they can neither exceed it nor starve asyncio.to_thread users
+_firecrawl_pool: ThreadPoolExecutor | None = None
+_firecrawl_pool_lock = threading.Lock()
+
+T = TypeVar("T")
+
+
+def _get_firecrawl_pool() -> ThreadPoolExecutor:
+    """Get the Firecrawl pool, sized by ``firecrawl_pool_workers``."""
+    global _firecrawl_pool
+    if _firecrawl_pool is None:
+        with _firecrawl_pool_lock:
+            if _firecrawl_pool is None:
+                _firecrawl_pool = ThreadPoolExecutor(
+                    max_workers=get_settings().firecrawl_pool_workers,
+                    thread_name_prefix="firecrawl",
+                )
+    return _firecrawl_pool
+
+
+async def _call(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking Firecrawl call on the Firecrawl pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_firecrawl_pool(), partial(fn, *args, **kwargs))
+
+
+@lru_cache(maxsize=4)
+def _get_firecrawl(api_key: str) -> FirecrawlApp:
+    """Get the shared Firecrawl client for an API key."""
+    return FirecrawlApp(api_key=api_key)
+
+
+def _search_key(query: str, max_results: int) -> str:
+    """Hash the search parameters into a cache key."""
+    params = json.dumps({"q": " ".join(query.lower().split()), "n": max_results}, sort_keys=True)
+    return hashlib.sha256(params.encode()).hexdigest()
+
+
+def _format_search_results(query: str, results: Any, max_results: int) -> str:
+    """Format a Firecrawl search response for the LLM."""
+    web = results.web if results else None
+    if not web:
+        return f"No results found for: {query}"
+
+    formatted = []
+    for item in web[:max_results]:
+        title = getattr(item, "title", None) or "No title"
+        url = getattr(item, "url", None) or ""
+        description = (getattr(item, "description", None) or "")[:300]
+        formatted.append(f"**{title}**\nURL: {url}\n{description}\n")
+
+    return "\n---\n".join(formatted)
+
+
+def _format_scrape_result(url: str, result: Any) -> str:
+    """Format a Firecrawl scrape response, truncating long pages."""
+    if not result:
+        return f"Could not scrape: {url}"
+
+    content = result.markdown or ""
+    # Truncate if too long
+    if len(content) > MAX_SCRAPE_CHARS:
+        content = content[:MAX_SCRAPE_CHARS] + "\n\n[Content truncated...]"
+
+    return content
+
+
+def _format_batch(urls: list[str], results: list[str]) -> str:
+    """Label each scraped page with its URL."""
+    return "\n\n---\n\n".join(
+        f"# {url}\n\n{result}" for url, result in zip(urls, results, strict=True)
+    )
+
 
 class FirecrawlSearchInput(BaseModel):
     """Input for Firecrawl search."""
@@ -26,29 +126,45 @@ class FirecrawlSearchTool(BaseTool):
 
     def __init__(self, api_key: str, **kwargs):
         super().__init__(api_key=api_key, **kwargs)
-        self._client = FirecrawlApp(api_key=api_key)
+        self._client = _get_firecrawl(api_key)
 
     def _run(self, query: str, max_results: int = 5) -> str:
         """Execute the web search."""
+        key = _search_key(query, max_results)
+        cached = _search_cache.get(key)
+        if cached is not None:
+            return cached
+
         try:
             # Use Firecrawl's search functionality
             results = self._client.search(
                 query=query,
                 limit=max_results,
             )
+            formatted = _format_search_results(query, results, max_results)
+            _search_cache.set(key, formatted)
+            return formatted
 
-            if not results or not results.get("data"):
-                return f"No results found for: {query}"
+        except Exception as e:
+            return f"Search error: {str(e)}"
 
-            # Format results
-            formatted = []
-            for item in results.get("data", [])[:max_results]:
-                title = item.get("title", "No title")
-                url = item.get("url", "")
-                description = item.get("description", item.get("markdown", ""))[:300]
-                formatted.append(f"**{title}**\nURL: {url}\n{description}\n")
+    async def _arun(self, query: str, max_results: int = 5) -> str:
+        """Execute the web search without blocking the event loop."""
+        key = _search_key(query, max_results)
+        cached = _search_cache.get(key)
+        if cached is not None:
+            return cached
 
-            return "\n---\n".join(formatted)
+        try:
+            # The Firecrawl SDK is synchronous; run it on the Firecrawl pool
+            results = await _call(
+                self._client.search,
+                query=query,
+                limit=max_results,
+            )
+            formatted = _format_search_results(query, results, max_results)
+            _search_cache.set(key, formatted)
+            return formatted
 
         except Exception as e:
             return f"Search error: {str(e)}"
@@ -67,25 +183,77 @@ class FirecrawlScrapeTool(BaseTool):
 
     def __init__(self, api_key: str, **kwargs):
         super().__init__(api_key=api_key, **kwargs)
-        self._client = FirecrawlApp(api_key=api_key)
+        self._client = _get_firecrawl(api_key)
 
     def _run(self, url: str) -> str:
         """Scrape the URL content."""
         try:
-            result = self._client.scrape_url(
-                url=url,
-                params={"formats": ["markdown"]},
-            )
-
-            if not result:
-                return f"Could not scrape: {url}"
+            result = self._client.scrape(url, **_SCRAPE_OPTIONS)
+            return _format_scrape_result(url, result)
 
-            content = result.get("markdown", "")
-            # Truncate if too long
-            if len(content) > 5000:
-                content = content[:5000] + "\n\n[Content truncated...]"
+        except Exception as e:
+            return f"Scrape error: {str(e)}"
 
-            return content
+    async def _arun(self, url: str) -> str:
+        """Scrape the URL content without blocking the event loop."""
+        try:
+            result = await _call(self._client.scrape, url, **_SCRAPE_OPTIONS)
+            return _format_scrape_result(url, result)
 
         except Exception as e:
             return f"Scrape error: {str(e)}"
+
+    async def batch_scrape(
+        self, urls: list[str], max_concurrency: int = MAX_CONCURRENT_SCRAPES
+    ) -> list[str]:
+        """Scrape several URLs concurrently.
+
+        At most ``max_concurrency`` scrapes are in flight at once. Results
+        are returned in the order of ``urls``.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def scrape(url: str) -> str:
+            async with semaphore:
+                return await self._arun(url)
+
+        return list(await asyncio.gather(*(scrape(url) for url in urls)))
+
+
+class FirecrawlBatchScrapeInput(BaseModel):
+    """Input for batched Firecrawl scraping."""
+
+    urls: list[str]
+
+
+class FirecrawlBatchScrapeTool(BaseTool):
+    """Tool for scraping several web pages in one call."""
+
+    name: str = "firecrawl_batch_scrape"
+    description: str = """Scrape several URLs at once and get their content in markdown format.
+    Prefer this over calling firecrawl_scrape repeatedly, e.g. for the top search hits.
+    Input should be a list of valid URLs."""
+    args_schema: type[BaseModel] = FirecrawlBatchScrapeInput
+
+    api_key: str
+
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key=api_key, **kwargs)
+
+    def _run(self, urls: list[str]) -> str:
+        """Scrape the URLs concurrently, at most ``MAX_CONCURRENT_SCRAPES`` at once.
+
+        CrewAI calls this from a worker thread with no running event loop,
+        so the async batch runs on a loop of its own.
+        """
+        if not urls:
+            return "No URLs given"
+        scraper = FirecrawlScrapeTool(api_key=self.api_key)
+        return _format_batch(urls, asyncio.run(scraper.batch_scrape(urls)))
+
+    async def _arun(self, urls: list[str]) -> str:
+        """Scrape the URLs without blocking the event loop."""
+        if not urls:
+            return "No URLs given"
+        scraper = FirecrawlScrapeTool(api_key=self.api_key)
+        return _format_batch(urls, await scraper.batch_scrape(urls))
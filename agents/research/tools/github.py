@@ -1,9 +1,289 @@
 """GitHub search tool for finding AI projects."""
 
+import asyncio
+import os
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
 import httpx
+import orjson
 from crewai.tools import BaseTool
 from pydantic import BaseModel
 
+from ..cache import DiskCache, TTLCache
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Separator between formatted repositories in tool output
+RESULT_SEPARATOR = "\n\n---\n\n"
+
+# Connection pool shared by every GitHub call in the process
+_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=30.0)
+_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+# Upper bound on repo-detail lookups in flight for one batch
+MAX_CONCURRENT_DETAILS = 10
+
+_DEFAULT_HEADERS = {
+    "Accept": "application/vnd.github.v3+json",
+    "User-Agent": "AI-Research-Agent",
+}
+
+# Search results keyed by normalized params; values are (etag, formatted repos).
+# Stale entries are revalidated with If-None-Match, and a 304 costs no quota.
+_search_cache = TTLCache(maxsize=512, ttl=600)
+
+# Repo details persisted per cache directory; entries hold the formatted
+# output plus the metadata ETag used to revalidate it
+DETAILS_CACHE_MAX_AGE = 86400
+_details_caches: dict[str, DiskCache] = {}
+_details_caches_lock = threading.Lock()
+
+# Lets the blocking details path fetch the README while the calling thread
+# fetches the repository metadata
+_README_POOL = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_DETAILS, thread_name_prefix="github-readme"
+)
+
+_sync_client: httpx.Client | None = None
+_sync_client_lock = threading.Lock()
+_async_client: httpx.AsyncClient | None = None
+
+
+def _get_sync_client() -> httpx.Client:
+    """Get the shared blocking client used from CrewAI worker threads."""
+    global _sync_client
+    if _sync_client is None:
+        with _sync_client_lock:
+            if _sync_client is None:
+                _sync_client = httpx.Client(
+                    http2=True,
+                    limits=_LIMITS,
+                    timeout=_TIMEOUT,
+                    headers=_DEFAULT_HEADERS,
+                )
+    return _sync_client
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Get the shared async client used from the server's event loop.
+
+    Creation does not await, so no other coroutine can interleave and a
+    lock is not needed.
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(
+            http2=True,
+            limits=_LIMITS,
+            timeout=_TIMEOUT,
+            headers=_DEFAULT_HEADERS,
+        )
+    return _async_client
+
+
+def _get_details_cache(cache_dir: str) -> DiskCache | None:
+    """Get the shared repo-details disk cache for a directory, if enabled."""
+    if not cache_dir:
+        return None
+    with _details_caches_lock:
+        if cache_dir not in _details_caches:
+            path = os.path.join(cache_dir, "github-details")
+            _details_caches[cache_dir] = DiskCache(path)
+        return _details_caches[cache_dir]
+
+
+def _cached_details(cache: DiskCache | None, repo_name: str) -> dict[str, Any] | None:
+    """Return a cached details entry that is young enough to revalidate."""
+    if cache is None:
+        return None
+    entry = cache.get(repo_name.lower())
+    if entry is None or time.time() - entry["stored_at"] > DETAILS_CACHE_MAX_AGE:
+        return None
+    return entry
+
+
+def _store_details(
+    cache: DiskCache | None, repo_name: str, response: httpx.Response, details: str
+) -> None:
+    """Persist formatted details along with the metadata ETag."""
+    etag = response.headers.get("ETag")
+    if cache is not None and etag:
+        cache.set(
+            repo_name.lower(),
+            {"etag": etag, "details": details, "stored_at": time.time()},
+        )
+
+
+def _revalidate_headers(token: str, entry: dict[str, Any]) -> dict[str, str]:
+    """Build repo metadata headers that revalidate a cached entry."""
+    return {**(_github_headers(token) or {}), "If-None-Match": entry["etag"]}
+
+
+def _revalidated_details(entry: dict[str, Any], response: httpx.Response) -> str | None:
+    """Return the cached details on a 304; otherwise None once the response checks out."""
+    if response.status_code == 304:
+        return entry["details"]
+    response.raise_for_status()
+    return None
+
+
+def _details_result(
+    cache: DiskCache | None, repo_name: str, response: httpx.Response, readme: str
+) -> str:
+    """Format a repo metadata response and persist it with its ETag."""
+    repo = orjson.loads(response.content)
+    details = _format_repo_details(repo_name, repo, readme)
+    _store_details(cache, repo_name, response, details)
+    return details
+
+
+async def close_clients() -> None:
+    """Close the shared GitHub clients and caches. Called on server shutdown."""
+    global _sync_client, _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+    if _sync_client is not None:
+        _sync_client.close()
+        _sync_client = None
+    for cache in _details_caches.values():
+        cache.close()
+
+
+def _github_headers(token: str) -> dict[str, str] | None:
+    """Build per-request GitHub API headers on top of the client defaults."""
+    return {"Authorization": f"token {token}"} if token else None
+
+
+def _search_params(query: str, max_results: int, sort: str) -> dict[str, Any]:
+    """Build query parameters for the repository search endpoint."""
+    return {
+        "q": f"{query} language:python",
+        "sort": sort,
+        "order": "desc",
+        "per_page": max_results,
+    }
+
+
+def _search_key(query: str, max_results: int, sort: str) -> tuple[str, int, str]:
+    """Build the search cache key from normalized parameters."""
+    return " ".join(query.lower().split()), max_results, sort
+
+
+def _search_headers(token: str, cached: tuple[Any, bool] | None) -> dict[str, str] | None:
+    """Build search headers, adding If-None-Match when a cached ETag exists."""
+    headers = _github_headers(token)
+    if cached is not None and cached[0][0]:
+        headers = {**(headers or {}), "If-None-Match": cached[0][0]}
+    return headers
+
+
+def _search_result(
+    key: tuple[str, int, str],
+    query: str,
+    response: httpx.Response,
+    max_results: int,
+    cached: tuple[Any, bool] | None,
+) -> tuple[str, ...]:
+    """Turn a search response into formatted repos, reusing the cache on 304."""
+    if response.status_code == 304 and cached is not None:
+        _search_cache.touch(key)
+        return cached[0][1]
+
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    result = tuple(_iter_search_results(query, data, max_results))
+    _search_cache.set(key, (response.headers.get("ETag"), result))
+    return result
+
+
+# One search hit as shown to the LLM
+_REPO_FMT = (
+    "**{name}** ⭐ {stars:,} | 🍴 {forks:,}\n"
+    "URL: {url}\n"
+    "Description: {description}\n"
+    "Topics: {topics}\n"
+    "Last Updated: {updated}"
+)
+
+
+def _iter_search_results(query: str, data: dict[str, Any], max_results: int) -> Iterator[str]:
+    """Format each repository in a search response for the LLM."""
+    if not data.get("items"):
+        yield f"No repositories found for: {query}"
+        return
+
+    for repo in data["items"][:max_results]:
+        yield _REPO_FMT.format(
+            name=repo.get("full_name") or "Unknown",
+            stars=repo.get("stargazers_count") or 0,
+            forks=repo.get("forks_count") or 0,
+            url=repo.get("html_url") or "",
+            description=(repo.get("description") or "No description")[:200],
+            topics=", ".join((repo.get("topics") or [])[:5]),
+            updated=(repo.get("updated_at") or "")[:10],
+        )
+
+
+def _readme_headers(token: str) -> dict[str, str]:
+    """Build headers that request the raw README body."""
+    return {**(_github_headers(token) or {}), "Accept": "application/vnd.github.raw+json"}
+
+
+def _readme_text(response: httpx.Response) -> str:
+    """Extract a README preview; a missing README yields an empty string."""
+    return response.text[:2000] if response.status_code == 200 else ""
+
+
+def _fetch_readme(client: httpx.Client, repo_name: str, token: str) -> str:
+    """Fetch a README preview, treating any failure as an empty README."""
+    try:
+        response = client.get(
+            f"{GITHUB_API_URL}/repos/{repo_name}/readme", headers=_readme_headers(token)
+        )
+        return _readme_text(response)
+    except Exception:
+        return ""
+
+
+async def _afetch_readme(client: httpx.AsyncClient, repo_name: str, token: str) -> str:
+    """Fetch a README preview without blocking the event loop."""
+    try:
+        response = await client.get(
+            f"{GITHUB_API_URL}/repos/{repo_name}/readme", headers=_readme_headers(token)
+        )
+        return _readme_text(response)
+    except Exception:
+        return ""
+
+
+def _format_repo_details(repo_name: str, repo: dict[str, Any], readme: str) -> str:
+    """Format repository metadata and README preview for the LLM."""
+    return f"""# {repo.get("full_name", repo_name)}
+
+**Description:** {repo.get("description", "No description")}
+
+**Stats:**
+- ⭐ Stars: {repo.get("stargazers_count", 0):,}
+- 🍴 Forks: {repo.get("forks_count", 0):,}
+- 👁️ Watchers: {repo.get("watchers_count", 0):,}
+- 🐛 Open Issues: {repo.get("open_issues_count", 0):,}
+
+**Info:**
+- Language: {repo.get("language", "Unknown")}
+- License: {repo.get("license", {}).get("name", "Unknown") if repo.get("license") else "Unknown"}
+- Created: {repo.get("created_at", "")[:10]}
+- Last Updated: {repo.get("updated_at", "")[:10]}
+
+**Topics:** {", ".join(repo.get("topics", []))}
+
+**README Preview:**
+{readme[:1500]}{"..." if len(readme) > 1500 else ""}
+"""
+
 
 class GitHubSearchInput(BaseModel):
     """Input for GitHub search."""
@@ -14,10 +294,15 @@ class GitHubSearchInput(BaseModel):
 
 
 class GitHubSearchTool(BaseTool):
-    """Tool for searching GitHub repositories."""
+    """Tool for searching GitHub repositories.
+
+    ``_run`` is the blocking entry point CrewAI calls from its worker thread;
+    ``_arun`` is the non-blocking equivalent for callers on the event loop,
+    and ``_arun_stream`` yields one formatted repository at a time.
+    """
 
     name: str = "github_search"
-    description: str = """Search GitHub for repositories related to AI, machine learning, 
+    description: str = """Search GitHub for repositories related to AI, machine learning,
     and open source projects. Returns repository names, descriptions, stars, and URLs.
     Use this to find popular and trending AI projects on GitHub.
     Input should be a search query for repositories."""
@@ -30,128 +315,200 @@ class GitHubSearchTool(BaseTool):
 
     def _run(self, query: str, max_results: int = 10, sort: str = "stars") -> str:
         """Search GitHub repositories."""
-        try:
-            headers = {
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "AI-Research-Agent",
-            }
-            if self.token:
-                headers["Authorization"] = f"token {self.token}"
-
-            # Search for repositories
-            params = {
-                "q": f"{query} language:python",
-                "sort": sort,
-                "order": "desc",
-                "per_page": max_results,
-            }
-
-            with httpx.Client() as client:
-                response = client.get(
-                    "https://api.github.com/search/repositories",
-                    headers=headers,
-                    params=params,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-            if not data.get("items"):
-                return f"No repositories found for: {query}"
-
-            # Format results
-            formatted = []
-            for repo in data["items"][:max_results]:
-                name = repo.get("full_name", "Unknown")
-                description = repo.get("description", "No description")[:200]
-                stars = repo.get("stargazers_count", 0)
-                forks = repo.get("forks_count", 0)
-                url = repo.get("html_url", "")
-                updated = repo.get("updated_at", "")[:10]
-                topics = ", ".join(repo.get("topics", [])[:5])
-
-                formatted.append(
-                    f"**{name}** ⭐ {stars:,} | 🍴 {forks:,}\n"
-                    f"URL: {url}\n"
-                    f"Description: {description}\n"
-                    f"Topics: {topics}\n"
-                    f"Last Updated: {updated}"
-                )
+        key = _search_key(query, max_results, sort)
+        cached = _search_cache.get_entry(key)
+        if cached is not None and cached[1]:
+            return RESULT_SEPARATOR.join(cached[0][1])
 
-            return "\n\n---\n\n".join(formatted)
+        try:
+            response = _get_sync_client().get(
+                f"{GITHUB_API_URL}/search/repositories",
+                headers=_search_headers(self.token, cached),
+                params=_search_params(query, max_results, sort),
+            )
+            return RESULT_SEPARATOR.join(_search_result(key, query, response, max_results, cached))
 
         except Exception as e:
             return f"GitHub search error: {str(e)}"
 
+    async def _arun(self, query: str, max_results: int = 10, sort: str = "stars") -> str:
+        """Search GitHub repositories without blocking the event loop."""
+        return RESULT_SEPARATOR.join(
+            [block async for block in self._arun_stream(query, max_results, sort)]
+        )
+
+    async def _arun_stream(
+        self, query: str, max_results: int = 10, sort: str = "stars"
+    ) -> AsyncIterator[str]:
+        """Yield each formatted repository as soon as the search returns.
+
+        GitHub answers with a single JSON document, so the first repository
+        is available once that body is parsed rather than after all results
+        are joined. Errors are yielded as a single message.
+        """
+        key = _search_key(query, max_results, sort)
+        cached = _search_cache.get_entry(key)
+        if cached is not None and cached[1]:
+            for block in cached[0][1]:
+                yield block
+            return
+
+        try:
+            response = await _get_async_client().get(
+                f"{GITHUB_API_URL}/search/repositories",
+                headers=_search_headers(self.token, cached),
+                params=_search_params(query, max_results, sort),
+            )
+            blocks = _search_result(key, query, response, max_results, cached)
+        except Exception as e:
+            yield f"GitHub search error: {str(e)}"
+            return
+
+        for block in blocks:
+            yield block
+
 
 class GitHubRepoDetailsTool(BaseTool):
-    """Tool for getting detailed information about a GitHub repository."""
+    """Tool for getting detailed information about a GitHub repository.
+
+    With ``cache_dir`` set, formatted details are kept on disk. A cached
+    entry is revalidated with a conditional request for the repository
+    metadata; a 304 returns it without refetching the README and costs no
+    rate-limit quota. Entries older than ``DETAILS_CACHE_MAX_AGE`` are
+    refetched unconditionally. ``_run`` and ``_arun`` differ only in how
+    they issue requests; the cache handling is shared through module helpers.
+    """
 
     name: str = "github_repo_details"
     description: str = """Get detailed information about a specific GitHub repository.
     Input should be the full repository name (e.g., 'langchain-ai/langchain')."""
 
     token: str = ""
+    cache_dir: str = ""
 
-    def __init__(self, token: str = "", **kwargs):
-        super().__init__(token=token, **kwargs)
+    def __init__(self, token: str = "", cache_dir: str = "", **kwargs):
+        super().__init__(token=token, cache_dir=cache_dir, **kwargs)
 
     def _run(self, repo_name: str) -> str:
         """Get repository details."""
         try:
-            headers = {
-                "Accept": "application/vnd.github.v3+json",
-                "User-Agent": "AI-Research-Agent",
-            }
-            if self.token:
-                headers["Authorization"] = f"token {self.token}"
-
-            with httpx.Client() as client:
-                # Get repo info
-                response = client.get(
-                    f"https://api.github.com/repos/{repo_name}",
-                    headers=headers,
-                    timeout=30.0,
-                )
+            client = _get_sync_client()
+            cache = _get_details_cache(self.cache_dir)
+            entry = _cached_details(cache, repo_name)
+            repo_url = f"{GITHUB_API_URL}/repos/{repo_name}"
+
+            if entry:
+                # Revalidate first; the README is only needed if it changed
+                response = client.get(repo_url, headers=_revalidate_headers(self.token, entry))
+                cached = _revalidated_details(entry, response)
+                if cached is not None:
+                    return cached
+                readme = _fetch_readme(client, repo_name, self.token)
+            else:
+                # Fetch the README on a pool thread while this one gets the repo info
+                readme_future = _README_POOL.submit(_fetch_readme, client, repo_name, self.token)
+                response = client.get(repo_url, headers=_github_headers(self.token))
                 response.raise_for_status()
-                repo = response.json()
+                readme = readme_future.result()
+
+            return _details_result(cache, repo_name, response, readme)
 
-                # Get README
+        except Exception as e:
+            return f"Error getting repo details: {str(e)}"
+
+    async def _arun(self, repo_name: str) -> str:
+        """Get repository details without blocking the event loop."""
+        try:
+            client = _get_async_client()
+            cache = _get_details_cache(self.cache_dir)
+            entry = _cached_details(cache, repo_name)
+            repo_url = f"{GITHUB_API_URL}/repos/{repo_name}"
+
+            if entry:
+                # Revalidate first; the README is only needed if it changed
+                response = await client.get(
+                    repo_url, headers=_revalidate_headers(self.token, entry)
+                )
+                cached = _revalidated_details(entry, response)
+                if cached is not None:
+                    return cached
+                readme = await _afetch_readme(client, repo_name, self.token)
+            else:
+                # Metadata and README are independent, so fetch them together
+                # (multiplexed over one HTTP/2 connection). The README fetch
+                # never raises; a failed metadata request cancels it.
                 try:
-                    readme_response = client.get(
-                        f"https://api.github.com/repos/{repo_name}/readme",
-                        headers={**headers, "Accept": "application/vnd.github.raw+json"},
-                        timeout=30.0,
-                    )
-                    readme = (
-                        readme_response.text[:2000] if readme_response.status_code == 200 else ""
-                    )
-                except Exception:
-                    readme = ""
-
-            # Format result
-            result = f"""# {repo.get("full_name", repo_name)}
+                    async with asyncio.TaskGroup() as tg:
+                        repo_task = tg.create_task(
+                            client.get(repo_url, headers=_github_headers(self.token))
+                        )
+                        readme_task = tg.create_task(_afetch_readme(client, repo_name, self.token))
+                except ExceptionGroup as eg:
+                    raise eg.exceptions[0] from None
+                response = repo_task.result()
+                response.raise_for_status()
+                readme = readme_task.result()
 
-**Description:** {repo.get("description", "No description")}
+            return _details_result(cache, repo_name, response, readme)
 
-**Stats:**
-- ⭐ Stars: {repo.get("stargazers_count", 0):,}
-- 🍴 Forks: {repo.get("forks_count", 0):,}
-- 👁️ Watchers: {repo.get("watchers_count", 0):,}
-- 🐛 Open Issues: {repo.get("open_issues_count", 0):,}
+        except Exception as e:
+            return f"Error getting repo details: {str(e)}"
 
-**Info:**
-- Language: {repo.get("language", "Unknown")}
-- License: {repo.get("license", {}).get("name", "Unknown") if repo.get("license") else "Unknown"}
-- Created: {repo.get("created_at", "")[:10]}
-- Last Updated: {repo.get("updated_at", "")[:10]}
+    async def get_details_batch(self, repo_names: list[str]) -> list[str]:
+        """Get details for several repositories concurrently.
 
-**Topics:** {", ".join(repo.get("topics", []))}
+        At most ``MAX_CONCURRENT_DETAILS`` lookups are in flight at once.
+        Results are returned in the order of ``repo_names``.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DETAILS)
 
-**README Preview:**
-{readme[:1500]}{"..." if len(readme) > 1500 else ""}
-"""
-            return result
+        async def fetch(repo_name: str) -> str:
+            async with semaphore:
+                return await self._arun(repo_name)
 
-        except Exception as e:
-            return f"Error getting repo details: {str(e)}"
+        results = await asyncio.gather(
+            *(fetch(name) for name in repo_names), return_exceptions=True
+        )
+        return [
+            f"Error getting repo details: {str(r)}" if isinstance(r, BaseException) else r
+            for r in results
+        ]
+
+
+class GitHubRepoDetailsBatchInput(BaseModel):
+    """Input for batched GitHub repository details."""
+
+    repo_names: list[str]
+
+
+class GitHubRepoDetailsBatchTool(BaseTool):
+    """Tool for getting details about several GitHub repositories in one call."""
+
+    name: str = "github_repo_details_batch"
+    description: str = """Get detailed information about several GitHub repositories at once.
+    Prefer this over calling github_repo_details repeatedly.
+    Input should be a list of full repository names
+    (e.g., ['langchain-ai/langchain', 'crewAIInc/crewAI'])."""
+    args_schema: type[BaseModel] = GitHubRepoDetailsBatchInput
+
+    token: str = ""
+    cache_dir: str = ""
+
+    def __init__(self, token: str = "", cache_dir: str = "", **kwargs):
+        super().__init__(token=token, cache_dir=cache_dir, **kwargs)
+
+    def _run(self, repo_names: list[str]) -> str:
+        """Get repository details using a thread per lookup."""
+        if not repo_names:
+            return "No repositories given"
+        details = GitHubRepoDetailsTool(token=self.token, cache_dir=self.cache_dir)
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DETAILS) as pool:
+            results = list(pool.map(details._run, repo_names))
+        return RESULT_SEPARATOR.join(results)
+
+    async def _arun(self, repo_names: list[str]) -> str:
+        """Get repository details without blocking the event loop."""
+        if not repo_names:
+            return "No repositories given"
+        details = GitHubRepoDetailsTool(token=self.token, cache_dir=self.cache_dir)
+        return RESULT_SEPARATOR.join(await details.get_details_batch(repo_names))
@@ -1,11 +1,14 @@
 """Standalone mock SSE server for testing frontend event handlers."""
 
 import asyncio
-import json
+import importlib.util
+import os
+from collections.abc import AsyncIterator, Callable
 from typing import Optional  # noqa: F401 - may be used for type hints
 
+import orjson
 import uvicorn
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 
@@ -20,135 +23,180 @@ app.add_middleware(
 )
 
 
-def format_event(event_type: str, payload: dict) -> str:
-    return f"data: {json.dumps({'type': event_type, 'payload': payload})}\n\n"
+def format_event(event_type: str, payload: dict) -> bytes:
+    return b"data: " + orjson.dumps({"type": event_type, "payload": payload}) + b"\n\n"
 
 
-async def mock_stream_generator(query: str):
-    """Generate mock SSE events for testing all frontend event handlers."""
+_FINAL_ANSWER = """# Response to: {query}
+
+## Key Insights
+
+1. **Knowledge Base**: Found 3 relevant documents on AI architectures
+2. **Research**: Analyzed 5 web sources and 12 GitHub repositories
+3. **Explanation**: Detailed technical breakdown with code examples
+
+## Summary
+
+AI agents are autonomous systems using LLMs for reasoning and tools for action. 
+Popular frameworks include CrewAI, LangGraph, and PydanticAI.
+
+---
+*Generated by Multi-Agent A2A System*"""
 
-    # === 1. Query Analysis ===
-    yield format_event("agent_start", {"agent": "router"})
-    yield format_event(
-        "message",
-        {"from": "user", "to": "router", "content": f"Query: {query[:60]}..."},
-    )
-    await asyncio.sleep(0.3)
 
-    yield format_event(
-        "message",
+def _final_response(query: str) -> bytes:
+    return format_event(
+        "complete",
         {
-            "from": "router",
-            "to": "agents",
-            "content": "Dispatching to: knowledge, research, explainer",
+            "answer": _FINAL_ANSWER.format(query=query),
+            "sources": [
+                "https://docs.crewai.com",
+                "https://langchain-ai.github.io/langgraph",
+                "https://github.com/pydantic/pydantic-ai",
+            ],
+            "agents_used": ["knowledge", "research", "explainer", "orchestrator"],
+            "duration": 4.5,
         },
     )
-    await asyncio.sleep(0.2)
 
-    # === 2. Knowledge Agent ===
-    yield format_event("agent_start", {"agent": "knowledge"})
-    yield format_event(
-        "message",
-        {"from": "router", "to": "knowledge", "content": f"Search: {query[:40]}..."},
-    )
-    await asyncio.sleep(0.3)
 
-    knowledge_chunks = [
-        "Found 3 relevant documents:\n",
-        "• AI Agent Architectures\n",
-        "• Multi-Agent Systems\n",
-        "• LLM Integration Patterns",
-    ]
-    for chunk in knowledge_chunks:
-        yield format_event("agent_output", {"agent": "knowledge", "content": chunk})
-        await asyncio.sleep(0.1)
-
-    yield format_event("agent_complete", {"agent": "knowledge", "duration": 0.8, "tokens": 156})
-    yield format_event(
-        "message",
-        {"from": "knowledge", "to": "synthesizer", "content": "Found 3 documents"},
-    )
-    await asyncio.sleep(0.2)
+# The whole stream as (event, delay after it) steps, built once at import.
+# Query-independent events are pre-encoded bytes; the few that embed the
+# query are functions of it.
+_SCRIPT: list[tuple[bytes | Callable[[str], bytes], float]] = []
 
-    # === 3. Research Agent ===
-    yield format_event("agent_start", {"agent": "research"})
-    yield format_event(
-        "message",
-        {"from": "router", "to": "research", "content": f"Research: {query[:40]}..."},
-    )
-    await asyncio.sleep(0.2)
 
-    yield format_event(
-        "tool_call",
-        {"agent": "research", "name": "web_search", "input": {"query": query[:30]}},
-    )
-    await asyncio.sleep(0.4)
+def _add(event_type: str, payload: dict, delay: float = 0.0) -> None:
+    _SCRIPT.append((format_event(event_type, payload), delay))
 
-    yield format_event(
-        "tool_result",
-        {"agent": "research", "name": "web_search", "output": "Found 5 relevant sources"},
-    )
-    await asyncio.sleep(0.2)
 
-    yield format_event(
-        "tool_call",
-        {"agent": "research", "name": "github_search", "input": {"topic": "AI agents"}},
-    )
-    await asyncio.sleep(0.3)
+def _add_dynamic(render: Callable[[str], bytes], delay: float = 0.0) -> None:
+    _SCRIPT.append((render, delay))
 
-    yield format_event(
-        "tool_result",
-        {"agent": "research", "name": "github_search", "output": "Found 12 repositories"},
-    )
-    await asyncio.sleep(0.2)
 
-    research_chunks = [
+def _add_outputs(agent: str, chunks: list[str], delay: float) -> None:
+    for chunk in chunks:
+        _add("agent_output", {"agent": agent, "content": chunk}, delay)
+
+
+# === 1. Query Analysis ===
+_add("agent_start", {"agent": "router"})
+_add_dynamic(
+    lambda q: format_event(
+        "message", {"from": "user", "to": "router", "content": f"Query: {q[:60]}..."}
+    ),
+    0.3,
+)
+_add(
+    "message",
+    {
+        "from": "router",
+        "to": "agents",
+        "content": "Dispatching to: knowledge, research, explainer",
+    },
+    0.2,
+)
+
+# === 2. Knowledge Agent ===
+_add("agent_start", {"agent": "knowledge"})
+_add_dynamic(
+    lambda q: format_event(
+        "message", {"from": "router", "to": "knowledge", "content": f"Search: {q[:40]}..."}
+    ),
+    0.3,
+)
+_add_outputs(
+    "knowledge",
+    [
+        "Found 3 relevant documents:\n",
+        "• AI Agent Architectures\n",
+        "• Multi-Agent Systems\n",
+        "• LLM Integration Patterns",
+    ],
+    0.1,
+)
+_add("agent_complete", {"agent": "knowledge", "duration": 0.8, "tokens": 156})
+_add(
+    "message",
+    {"from": "knowledge", "to": "synthesizer", "content": "Found 3 documents"},
+    0.2,
+)
+
+# === 3. Research Agent ===
+_add("agent_start", {"agent": "research"})
+_add_dynamic(
+    lambda q: format_event(
+        "message", {"from": "router", "to": "research", "content": f"Research: {q[:40]}..."}
+    ),
+    0.2,
+)
+_add_dynamic(
+    lambda q: format_event(
+        "tool_call", {"agent": "research", "name": "web_search", "input": {"query": q[:30]}}
+    ),
+    0.4,
+)
+_add(
+    "tool_result",
+    {"agent": "research", "name": "web_search", "output": "Found 5 relevant sources"},
+    0.2,
+)
+_add(
+    "tool_call",
+    {"agent": "research", "name": "github_search", "input": {"topic": "AI agents"}},
+    0.3,
+)
+_add(
+    "tool_result",
+    {"agent": "research", "name": "github_search", "output": "Found 12 repositories"},
+    0.2,
+)
+_add_outputs(
+    "research",
+    [
         "## Research Findings\n\n",
         "**Web Sources:** 5 papers analyzed\n",
         "**GitHub:** 12 repos reviewed\n\n",
         "Key frameworks: CrewAI, LangGraph, AutoGPT\n",
         "Trend: Multi-agent collaboration\n",
-    ]
-    for chunk in research_chunks:
-        yield format_event("agent_output", {"agent": "research", "content": chunk})
-        await asyncio.sleep(0.1)
-
-    yield format_event("agent_complete", {"agent": "research", "duration": 2.3, "tokens": 487})
-    yield format_event(
-        "message",
-        {
-            "from": "research",
-            "to": "synthesizer",
-            "content": "Research complete: 5 sources, 12 repos",
-        },
-    )
-    await asyncio.sleep(0.2)
-
-    # === 4. Explainer Agent ===
-    yield format_event("agent_start", {"agent": "explainer"})
-    yield format_event(
-        "message",
-        {
-            "from": "router",
-            "to": "explainer",
-            "content": "Generate explanation with code examples",
-        },
-    )
-    await asyncio.sleep(0.2)
-
-    yield format_event(
-        "tool_call",
-        {"agent": "explainer", "name": "context7_lookup", "input": {"topic": "AI agents"}},
-    )
-    await asyncio.sleep(0.3)
-
-    yield format_event(
-        "tool_result",
-        {"agent": "explainer", "name": "context7_lookup", "output": "Documentation retrieved"},
-    )
-    await asyncio.sleep(0.2)
+    ],
+    0.1,
+)
+_add("agent_complete", {"agent": "research", "duration": 2.3, "tokens": 487})
+_add(
+    "message",
+    {
+        "from": "research",
+        "to": "synthesizer",
+        "content": "Research complete: 5 sources, 12 repos",
+    },
+    0.2,
+)
 
-    explainer_chunks = [
+# === 4. Explainer Agent ===
+_add("agent_start", {"agent": "explainer"})
+_add(
+    "message",
+    {
+        "from": "router",
+        "to": "explainer",
+        "content": "Generate explanation with code examples",
+    },
+    0.2,
+)
+_add(
+    "tool_call",
+    {"agent": "explainer", "name": "context7_lookup", "input": {"topic": "AI agents"}},
+    0.3,
+)
+_add(
+    "tool_result",
+    {"agent": "explainer", "name": "context7_lookup", "output": "Documentation retrieved"},
+    0.2,
+)
+_add_outputs(
+    "explainer",
+    [
         "## AI Agents Explained\n\n",
         "AI agents are systems that can:\n",
         "• **Perceive**: Understand context\n",
@@ -158,82 +206,66 @@ async def mock_stream_generator(query: str):
         "from crewai import Agent\n",
         "agent = Agent(role='Researcher')\n",
         "```",
-    ]
-    for chunk in explainer_chunks:
-        yield format_event("agent_output", {"agent": "explainer", "content": chunk})
-        await asyncio.sleep(0.08)
-
-    yield format_event("agent_complete", {"agent": "explainer", "duration": 1.8, "tokens": 623})
-    yield format_event(
-        "message",
-        {
-            "from": "explainer",
-            "to": "synthesizer",
-            "content": "Explanation ready with code examples",
-        },
-    )
-    await asyncio.sleep(0.2)
-
-    # === 5. Synthesis ===
-    yield format_event("agent_start", {"agent": "synthesizer"})
-    yield format_event(
-        "message",
-        {"from": "synthesizer", "to": "user", "content": "Combining all responses..."},
-    )
-    await asyncio.sleep(0.2)
+    ],
+    0.08,
+)
+_add("agent_complete", {"agent": "explainer", "duration": 1.8, "tokens": 623})
+_add(
+    "message",
+    {
+        "from": "explainer",
+        "to": "synthesizer",
+        "content": "Explanation ready with code examples",
+    },
+    0.2,
+)
 
-    synthesis_chunks = [
+# === 5. Synthesis ===
+_add("agent_start", {"agent": "synthesizer"})
+_add(
+    "message",
+    {"from": "synthesizer", "to": "user", "content": "Combining all responses..."},
+    0.2,
+)
+_add_outputs(
+    "synthesizer",
+    [
         "## Synthesis\n\n",
         "**Sources analyzed:**\n",
         "• Knowledge: 3 docs\n",
         "• Research: 5 web + 12 repos\n",
         "• Explainer: Technical breakdown\n\n",
         "**Quality checks:** ✓ All passed\n",
-    ]
-    for chunk in synthesis_chunks:
-        yield format_event("agent_output", {"agent": "synthesizer", "content": chunk})
-        await asyncio.sleep(0.08)
-
-    yield format_event("agent_complete", {"agent": "synthesizer", "duration": 4.5, "tokens": 1266})
-    yield format_event("agent_complete", {"agent": "router", "duration": 0.5, "tokens": 120})
-    await asyncio.sleep(0.1)
-
-    # === 6. Final Response ===
-    answer = f"""# Response to: {query}
+    ],
+    0.08,
+)
+_add("agent_complete", {"agent": "synthesizer", "duration": 4.5, "tokens": 1266})
+_add("agent_complete", {"agent": "router", "duration": 0.5, "tokens": 120}, 0.1)
 
-## Key Insights
+# === 6. Final Response ===
+_add_dynamic(_final_response)
 
-1. **Knowledge Base**: Found 3 relevant documents on AI architectures
-2. **Research**: Analyzed 5 web sources and 12 GitHub repositories
-3. **Explanation**: Detailed technical breakdown with code examples
 
-## Summary
+async def mock_stream_generator(
+    query: str, fast: bool = False, speed: float = 1.0
+) -> AsyncIterator[bytes]:
+    """Generate mock SSE events for testing all frontend event handlers.
 
-AI agents are autonomous systems using LLMs for reasoning and tools for action. 
-Popular frameworks include CrewAI, LangGraph, and PydanticAI.
-
----
-*Generated by Multi-Agent A2A System*"""
-
-    yield format_event(
-        "complete",
-        {
-            "answer": answer,
-            "sources": [
-                "https://docs.crewai.com",
-                "https://langchain-ai.github.io/langgraph",
-                "https://github.com/pydantic/pydantic-ai",
-            ],
-            "agents_used": ["knowledge", "research", "explainer", "orchestrator"],
-            "duration": 4.5,
-        },
-    )
+    Delays are divided by ``speed``; with ``fast`` set they are skipped.
+    """
+    for event, delay in _SCRIPT:
+        yield event if isinstance(event, bytes) else event(query)
+        if delay and not fast:
+            await asyncio.sleep(delay / speed)
 
 
 @app.post("/stream")
 @app.post("/stream/mock")
-async def mock_stream(request: Request):
-    """Mock SSE stream for testing frontend."""
+async def mock_stream(request: Request, fast: bool = False, speed: float = Query(1.0, gt=0)):
+    """Mock SSE stream for testing frontend.
+
+    Pass ``?speed=N`` to run N times faster, or ``?fast=1`` to skip delays.
+    """
     try:
         body = await request.json()
         query = body.get("query", "Tell me about AI agents")
@@ -243,7 +275,7 @@ async def mock_stream(request: Request):
     print(f"Starting mock stream for: {query[:50]}...")
 
     return StreamingResponse(
-        mock_stream_generator(query),
+        mock_stream_generator(query, fast, speed),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -258,6 +290,19 @@ async def health():
     return {"status": "healthy", "agent": "mock-server"}
 
 
+# uvloop has no Windows build; uvicorn's "auto" loop falls back to asyncio
+_LOOP = "uvloop" if importlib.util.find_spec("uvloop") is not None else "auto"
+
 if __name__ == "__main__":
-    print("Starting Mock SSE Server on http://localhost:8000")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # The mock holds no state, so it can fan out across worker processes
+    workers = int(os.getenv("WORKERS", max(1, (os.cpu_count() or 1) // 2)))
+    print(f"Starting Mock SSE Server on http://localhost:8000 ({workers} workers)")
+    uvicorn.run(
+        "mock_server:app",
+        host="0.0.0.0",
+        port=8000,
+        loop=_LOOP,
+        http="httptools",
+        workers=workers,
+        log_level="warning",
+    )
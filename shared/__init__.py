@@ -1,16 +1,65 @@
-"""Shared utilities for multi-agent A2A system."""
+"""Shared utilities for multi-agent A2A system.
 
-from shared.a2a_utils import A2AClient, create_agent_card
-from shared.config import Settings
-from shared.logging_config import setup_logging
-from shared.models import ModelFactory
-from shared.token_manager import TokenManager
+Exports are resolved on first attribute access, so importing one
+submodule (e.g. ``shared.config``) does not load the others. Set
+``A2A_EAGER_IMPORT=1`` to resolve everything at import time, which
+surfaces broken imports immediately (useful in CI).
+"""
+
+import importlib
+import os
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from shared.a2a_utils import (
+        A2AClient,
+        create_agent_card,
+        create_agent_card_bytes,
+        get_a2a_client,
+    )
+    from shared.config import Settings
+    from shared.logging_config import setup_logging
+    from shared.models import ModelFactory
+    from shared.token_manager import TokenManager
+
+# Exported name -> module that defines it
+_EXPORTS = {
+    "Settings": "shared.config",
+    "ModelFactory": "shared.models",
+    "TokenManager": "shared.token_manager",
+    "create_agent_card": "shared.a2a_utils",
+    "create_agent_card_bytes": "shared.a2a_utils",
+    "A2AClient": "shared.a2a_utils",
+    "get_a2a_client": "shared.a2a_utils",
+    "setup_logging": "shared.logging_config",
+}
 
 __all__ = [
     "Settings",
     "ModelFactory",
     "TokenManager",
     "create_agent_card",
+    "create_agent_card_bytes",
     "A2AClient",
+    "get_a2a_client",
     "setup_logging",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if os.getenv("A2A_EAGER_IMPORT") == "1":
+    for _name in __all__:
+        __getattr__(_name)
@@ -1,10 +1,78 @@
 """A2A protocol utilities for all agents."""
 
+import asyncio
+import time
+from collections import deque
 from typing import Any
 
 import httpx
+import orjson
 from pydantic import BaseModel
 
+# Connection pool for calls between agents; the orchestrator fans out to
+# several agents per query, so keep connections warm and allow bursts
+A2A_CLIENT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
+
+# tasks/send envelope split around the message text and request id, so
+# send_task only has to encode those two values
+_TASK_SEND_PREFIX = (
+    b'{"jsonrpc":"2.0","method":"tasks/send","params":{"message":{"role":"user","parts":[{"text":'
+)
+_TASK_SEND_ID = b'}]}},"id":'
+_TASK_SEND_SUFFIX = b"}"
+
+# Normalized once; httpx copies rather than mutates request headers
+_JSON_HEADERS = httpx.Headers({"Content-Type": "application/json", "Accept": "application/json"})
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+# Error envelopes for the standard codes, encoded up to the message text
+_ERROR_PREFIXES = {
+    code: b'{"jsonrpc":"2.0","error":{"code":%d,"message":' % code
+    for code in (PARSE_ERROR, INVALID_REQUEST, METHOD_NOT_FOUND, INVALID_PARAMS, INTERNAL_ERROR)
+}
+_ERROR_ID = b'},"id":'
+
+# Adaptive concurrency for calls to one agent: start here and never exceed
+# the connection pool
+A2A_INITIAL_CONCURRENCY = 10
+
+# Circuit breaker: this many failed calls within the window stop calls to
+# the agent for the cooldown
+A2A_FAILURE_THRESHOLD = 5
+A2A_FAILURE_WINDOW_SECONDS = 30.0
+A2A_CIRCUIT_COOLDOWN_SECONDS = 30.0
+
+
+# Likely causes of error statuses from an agent, added to the raised error
+_STATUS_HINTS = {
+    403: (
+        "This usually means Azure OpenAI rejected the request "
+        "(check service principal permissions or token validity)"
+    ),
+}
+
+
+def _error_detail(response: httpx.Response) -> str:
+    """Extract the JSON-RPC error message, or the start of the body."""
+    try:
+        error_body = orjson.loads(response.content)
+        if "error" in error_body:
+            return f" - {error_body['error'].get('message', '')}"
+    except Exception:
+        return f" - {response.text[:200]}" if response.text else ""
+    return ""
+
 
 class AgentSkill(BaseModel):
     """A2A Agent Skill definition."""
@@ -49,20 +117,169 @@ def create_agent_card(
     )
 
 
+def create_agent_card_bytes(
+    name: str,
+    description: str,
+    url: str,
+    skills: list[dict[str, str]],
+    version: str = "1.0.0",
+) -> bytes:
+    """Create an A2A Agent Card serialized as JSON, for serving as-is."""
+    return create_agent_card(name, description, url, skills, version).model_dump_json().encode()
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an agent that has been failing repeatedly."""
+
+
+class AdaptiveLimiter:
+    """Concurrency cap for one agent that adapts to its latency.
+
+    The cap grows by about one slot per ``limit`` successful calls while the
+    short-term latency average stays within ``overload_factor`` of the
+    long-term one, and shrinks by a quarter when it does not or a call
+    fails. After ``failure_threshold`` failures within ``failure_window``
+    seconds the circuit opens and ``acquire`` raises ``CircuitOpenError``
+    for ``cooldown`` seconds. The first call after that is a trial, and
+    other calls are rejected until it finishes: a failure reopens the
+    circuit, a success closes it, and a cancelled trial lets the next call
+    try again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_limit: int = A2A_CLIENT_LIMITS.max_connections,
+        initial_limit: int = A2A_INITIAL_CONCURRENCY,
+        failure_threshold: int = A2A_FAILURE_THRESHOLD,
+        failure_window: float = A2A_FAILURE_WINDOW_SECONDS,
+        cooldown: float = A2A_CIRCUIT_COOLDOWN_SECONDS,
+        overload_factor: float = 2.0,
+    ):
+        self.name = name
+        self.max_limit = max_limit
+        self.limit = float(min(initial_limit, max_limit))
+        self.failure_threshold = failure_threshold
+        self.failure_window = failure_window
+        self.cooldown = cooldown
+        self.overload_factor = overload_factor
+
+        self._in_flight = 0
+        self._waiters: list[asyncio.Future[None]] = []
+        self._latency: float | None = None  # fast EWMA, seconds
+        self._baseline: float | None = None  # slow EWMA, seconds
+        self._failures: deque[float] = deque()
+        self._opened_at: float | None = None
+        self._half_open = False
+        self._trial_in_flight = False
+
+    async def acquire(self) -> bool:
+        """Wait for a free slot, or raise if the circuit is open.
+
+        Returns True if this call is the half-open trial; pass that on to
+        ``release``.
+        """
+        self._check_circuit()
+        while self._in_flight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+        # Check again: the circuit may have changed while this call waited
+        trial = self._check_circuit()
+        if trial:
+            self._trial_in_flight = True
+        self._in_flight += 1
+        return trial
+
+    def _check_circuit(self) -> bool:
+        """Raise unless a call may start; return True if it would be the trial."""
+        if self._opened_at is not None:
+            if time.monotonic() - self._opened_at < self.cooldown:
+                raise CircuitOpenError(
+                    f"Circuit open for agent at {self.name} after repeated failures"
+                )
+            self._opened_at = None
+            self._half_open = True
+        if self._half_open and self._trial_in_flight:
+            raise CircuitOpenError(f"Circuit half-open for agent at {self.name}; trial in flight")
+        return self._half_open
+
+    def release(self, latency: float | None, failed: bool = False, trial: bool = False) -> None:
+        """Free a slot and record how the call went.
+
+        ``latency`` is None for calls that ended without an outcome, such as
+        cancellations; those only free the slot. ``trial`` is the value
+        ``acquire`` returned.
+        """
+        if trial:
+            self._trial_in_flight = False
+        if failed:
+            self._record_failure(trial)
+        elif latency is not None:
+            self._record_success(latency, trial)
+
+        self._in_flight -= 1
+        # Waiters re-check the cap, so waking all of them is safe
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def _record_success(self, latency: float, trial: bool) -> None:
+        if trial:
+            self._half_open = False
+        if self._latency is None:
+            self._latency = self._baseline = latency
+        else:
+            self._latency += 0.2 * (latency - self._latency)
+            self._baseline += 0.02 * (latency - self._baseline)
+
+        if self._latency > self.overload_factor * self._baseline:
+            self.limit = max(1.0, self.limit * 0.75)
+        else:
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+
+    def _record_failure(self, trial: bool) -> None:
+        now = time.monotonic()
+        self.limit = max(1.0, self.limit * 0.75)
+        self._failures.append(now)
+        while self._failures and self._failures[0] < now - self.failure_window:
+            self._failures.popleft()
+        if trial or len(self._failures) >= self.failure_threshold:
+            self._opened_at = now
+            self._half_open = False
+            self._failures.clear()
+
+
 class A2AClient:
-    """Client for calling other A2A agents."""
+    """Client for calling other A2A agents.
+
+    Prefer ``get_a2a_client`` so calls to the same agent share one
+    connection pool for the life of the process.
+    """
 
     def __init__(self, base_url: str, timeout: float = 60.0):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self._shared = False
+        # Fail fast on unreachable agents; agent work itself can take a while
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=5.0),
+            limits=A2A_CLIENT_LIMITS,
+        )
+        self._limiter = AdaptiveLimiter(self.base_url)
 
     async def get_agent_card(self) -> AgentCard | None:
         """Discover agent capabilities via Agent Card."""
         try:
             response = await self._client.get(f"{self.base_url}/.well-known/agent.json")
             response.raise_for_status()
-            return AgentCard(**response.json())
+            return AgentCard.model_validate_json(response.content)
         except Exception:
             return None
 
@@ -71,46 +288,53 @@ class A2AClient:
         message: str,
         task_id: str | None = None,
     ) -> dict[str, Any]:
-        """Send a task to the agent using A2A protocol."""
-        payload = {
-            "jsonrpc": "2.0",
-            "method": "tasks/send",
-            "params": {
-                "message": {
-                    "role": "user",
-                    "parts": [{"text": message}],
-                }
-            },
-            "id": task_id or "1",
-        }
+        """Send a task to the agent using A2A protocol.
+
+        Concurrent calls are capped by the client's ``AdaptiveLimiter``;
+        raises ``CircuitOpenError`` while the agent is failing repeatedly.
+        """
+        payload = (
+            _TASK_SEND_PREFIX
+            + orjson.dumps(message)
+            + _TASK_SEND_ID
+            + orjson.dumps(task_id or "1")
+            + _TASK_SEND_SUFFIX
+        )
+
+        trial = await self._limiter.acquire()
+        started = time.monotonic()
+        try:
+            result = await self._post_task(payload)
+        except httpx.HTTPError:
+            self._limiter.release(time.monotonic() - started, failed=True, trial=trial)
+            raise
+        except BaseException:
+            self._limiter.release(None, trial=trial)
+            raise
+        self._limiter.release(time.monotonic() - started, trial=trial)
+        return result
 
+    async def _post_task(self, payload: bytes) -> dict[str, Any]:
+        """POST an encoded tasks/send request and decode the response."""
         try:
             response = await self._client.post(
                 f"{self.base_url}/a2a",
-                json=payload,
-                headers={"Content-Type": "application/json"},
+                content=payload,
+                headers=_JSON_HEADERS,
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             # The target agent returned an error status code
-            error_detail = ""
-            try:
-                error_body = e.response.json()
-                if "error" in error_body:
-                    error_detail = f" - {error_body['error'].get('message', '')}"
-            except Exception:
-                error_detail = f" - {e.response.text[:200]}" if e.response.text else ""
-
-            if e.response.status_code == 403:
-                raise httpx.HTTPStatusError(
-                    f"Agent at {self.base_url} returned 403 Forbidden. "
-                    f"This usually means Azure OpenAI rejected the request "
-                    f"(check service principal permissions or token validity){error_detail}",
-                    request=e.request,
-                    response=e.response,
-                ) from e
-            raise
+            hint = _STATUS_HINTS.get(e.response.status_code)
+            if hint is None:
+                raise
+            raise httpx.HTTPStatusError(
+                f"Agent at {self.base_url} returned {e.response.status_code} "
+                f"{e.response.reason_phrase}. {hint}{_error_detail(e.response)}",
+                request=e.request,
+                response=e.response,
+            ) from e
         except httpx.ConnectError as e:
             raise httpx.ConnectError(
                 f"Failed to connect to agent at {self.base_url}. "
@@ -131,7 +355,36 @@ class A2AClient:
         return self
 
     async def __aexit__(self, *args):
-        await self.close()
+        # Shared clients stay open until close_a2a_clients()
+        if not self._shared:
+            await self.close()
+
+
+_CLIENTS: dict[str, A2AClient] = {}
+
+
+def get_a2a_client(base_url: str) -> A2AClient:
+    """Get the process-wide A2A client for an agent URL.
+
+    Creating the client does not await, so concurrent callers on the event
+    loop cannot race. Leaving an ``async with`` block does not close a
+    shared client; call ``close_a2a_clients`` on shutdown instead.
+    """
+    key = base_url.rstrip("/")
+    client = _CLIENTS.get(key)
+    if client is None:
+        client = A2AClient(key)
+        client._shared = True
+        _CLIENTS[key] = client
+    return client
+
+
+async def close_a2a_clients() -> None:
+    """Close every shared A2A client."""
+    clients = list(_CLIENTS.values())
+    _CLIENTS.clear()
+    for client in clients:
+        await client.close()
 
 
 def create_a2a_response(
@@ -167,3 +420,15 @@ def create_a2a_error(
         },
         "id": request_id,
     }
+
+
+def create_a2a_error_bytes(
+    code: int,
+    message: str,
+    request_id: str = "1",
+) -> bytes:
+    """Create a JSON-RPC 2.0 error response serialized as JSON."""
+    prefix = _ERROR_PREFIXES.get(code)
+    if prefix is None:
+        return orjson.dumps(create_a2a_error(code, message, request_id))
+    return prefix + orjson.dumps(message) + _ERROR_ID + orjson.dumps(request_id) + b"}"
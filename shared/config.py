@@ -1,6 +1,6 @@
 """Shared configuration settings for all agents."""
 
-from functools import lru_cache
+from dataclasses import dataclass
 
 from pydantic_settings import BaseSettings
 
@@ -10,7 +10,7 @@ class Settings(BaseSettings):
 
     # Azure OpenAI settings (uses Entra ID auth)
     azure_openai_endpoint: str = ""
-    azure_openai_deployment: str = ""
+    azure_openai_deployment: str = "gpt-4o"
     azure_openai_api_version: str = "2024-02-15-preview"
 
     # Azure OpenAI Embedding settings
@@ -21,6 +21,11 @@ class Settings(BaseSettings):
     azure_client_id: str = ""
     azure_client_secret: str = ""
 
+    # Persist Entra ID tokens across restarts (MSAL cache on disk); where no
+    # OS keyring exists (e.g. containers) it must be allowed unencrypted
+    azure_token_cache_persistent: bool = False
+    azure_token_cache_allow_unencrypted: bool = False
+
     # Agent URLs
     research_agent_url: str = "http://localhost:8001"
     explainer_agent_url: str = "http://localhost:8002"
@@ -29,15 +34,41 @@ class Settings(BaseSettings):
     # Server Settings
     host: str = "0.0.0.0"
     port: int = 8000
+    workers: int = 1  # uvicorn worker processes; agents keep in-process state
 
+    # Frozen: settings are read-only once loaded and shared process-wide
     model_config = {
+        "frozen": True,
         "env_file": ".env",
         "env_file_encoding": "utf-8",
         "extra": "ignore",
     }
 
 
-@lru_cache
+@dataclass(frozen=True, slots=True)
+class AgentEndpoints:
+    """Base URLs of the downstream agents, normalized once at startup."""
+
+    research: str
+    explainer: str
+    knowledge: str
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "AgentEndpoints":
+        """Build the endpoints from the agent URL settings."""
+        return cls(
+            research=settings.research_agent_url.rstrip("/"),
+            explainer=settings.explainer_agent_url.rstrip("/"),
+            knowledge=settings.knowledge_agent_url.rstrip("/"),
+        )
+
+
+_SETTINGS: Settings | None = None
+
+
 def get_settings() -> Settings:
     """Get cached base settings."""
-    return Settings()
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = Settings()
+    return _SETTINGS
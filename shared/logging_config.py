@@ -1,9 +1,48 @@
 """Shared logging configuration for all agents."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Literal
 
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+}
+
+# Timestamp, level, agent name, and message; shared by every handler
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Set once the root logger has a handler for third-party library logs
+_CONFIGURED = False
+
+# Loggers only enqueue records; one background thread formats them and
+# writes to stdout, so a slow stdout never stalls a request handler
+_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_LISTENER: QueueListener | None = None
+
+
+def _queue_handler(level: int) -> QueueHandler:
+    """Create a handler that hands records to the stdout writer thread."""
+    global _LISTENER
+    if _LISTENER is None:
+        stdout_handler = logging.StreamHandler(sys.stdout)
+        stdout_handler.setFormatter(_FORMATTER)
+        _LISTENER = QueueListener(_QUEUE, stdout_handler)
+        _LISTENER.start()
+        # Flush queued records on interpreter exit
+        atexit.register(_LISTENER.stop)
+    handler = QueueHandler(_QUEUE)
+    handler.setLevel(level)
+    return handler
+
 
 def setup_logging(
     agent_name: str,
@@ -12,7 +51,8 @@ def setup_logging(
     """
     Set up logging for an agent with proper formatting for Docker.
     
-    Logs are written to stdout/stderr to be captured by Docker.
+    Logs are written to stdout/stderr to be captured by Docker. Records are
+    queued and written by a background thread.
     
     Args:
         agent_name: Name of the agent for the logger
@@ -22,33 +62,23 @@ def setup_logging(
         Configured logger instance
     """
     # Create a logger for the agent
+    log_level = _LEVELS[level]
     logger = logging.getLogger(agent_name)
-    logger.setLevel(getattr(logging, level))
+    logger.setLevel(log_level)
     
     # Avoid duplicate handlers if already configured
     if logger.handlers:
         return logger
     
-    # Create console handler that writes to stdout
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(getattr(logging, level))
-    
-    # Create a formatter with timestamp, level, agent name, and message
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    console_handler.setFormatter(formatter)
-    
-    # Add handler to logger
-    logger.addHandler(console_handler)
+    # Add a handler that queues records for the stdout writer
+    logger.addHandler(_queue_handler(log_level))
     
     # Also configure the root logger to capture third-party library logs
-    root_logger = logging.getLogger()
-    if not root_logger.handlers:
-        root_handler = logging.StreamHandler(sys.stdout)
-        root_handler.setLevel(logging.WARNING)
-        root_handler.setFormatter(formatter)
-        root_logger.addHandler(root_handler)
+    global _CONFIGURED
+    if not _CONFIGURED:
+        root_logger = logging.getLogger()
+        if not root_logger.handlers:
+            root_logger.addHandler(_queue_handler(logging.WARNING))
+        _CONFIGURED = True
     
     return logger
@@ -2,56 +2,186 @@
 
 Provides factory methods to create LLM instances for different frameworks
 (PydanticAI, Agno, CrewAI, OpenAI client) using Azure OpenAI with Entra ID auth.
-All token management is handled by the centralized TokenManager.
+All token management is handled by the centralized TokenManager, and all
+OpenAI clients share one HTTP connection pool per sync/async flavour.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import threading
+from collections.abc import Callable
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
+import httpx
+
+from shared.token_manager import TokenManager
+
 if TYPE_CHECKING:
     from shared.config import Settings
 
 # Set up module logger
 logger = logging.getLogger("model-factory")
 
+# Connection pool shared by every Azure OpenAI client in the process, so
+# chat and embedding calls reuse the same connections to the endpoint
+MODEL_CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=30)
+MODEL_CLIENT_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+# Connection attempts retried by the transport before an error surfaces
+MODEL_CLIENT_CONNECT_RETRIES = 2
+
+_http_client: httpx.Client | None = None
+_http_client_lock = threading.Lock()
+_async_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.Client:
+    """Get the shared sync HTTP client for Azure OpenAI clients."""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                transport = httpx.HTTPTransport(
+                    http2=True,
+                    limits=MODEL_CLIENT_LIMITS,
+                    retries=MODEL_CLIENT_CONNECT_RETRIES,
+                )
+                _http_client = httpx.Client(
+                    transport=transport,
+                    timeout=MODEL_CLIENT_TIMEOUT,
+                    follow_redirects=True,
+                )
+                # Sync callers (e.g. Agno) have no shutdown hook of their own
+                atexit.register(_http_client.close)
+    return _http_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client for Azure OpenAI clients.
+
+    Must be used from the agent's event loop only.
+    """
+    global _async_http_client
+    if _async_http_client is None:
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=MODEL_CLIENT_LIMITS,
+            retries=MODEL_CLIENT_CONNECT_RETRIES,
+        )
+        _async_http_client = httpx.AsyncClient(
+            transport=transport,
+            timeout=MODEL_CLIENT_TIMEOUT,
+            follow_redirects=True,
+        )
+    return _async_http_client
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP clients.
+
+    Also drops ModelFactory's cached clients and models, which hold the
+    closed HTTP clients, so later factory calls build on a fresh pool.
+    """
+    global _http_client, _async_http_client
+    if _async_http_client is not None:
+        await _async_http_client.aclose()
+        _async_http_client = None
+    with _http_client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+    ModelFactory.clear_cache()
+
 
 class ModelFactory:
     """Factory for creating Azure OpenAI LLM instances.
 
     All instances use the centralized TokenManager for authentication.
     Ensure TokenManager.initialize(settings) is called before using any
-    factory methods.
+    factory methods. Everything except the CrewAI LLM is built once per
+    configuration and reused; ``clear_cache`` drops those instances.
     """
 
+    _token_provider_fn: Callable[[], str] | None = None
+
     @staticmethod
-    def _get_token_manager():
+    def _get_token_manager() -> TokenManager:
         """Get the TokenManager singleton instance."""
-        from shared.token_manager import TokenManager
-
         return TokenManager.get_instance()
 
+    @classmethod
+    def _token_provider(cls) -> Callable[[], str]:
+        """Get the TokenManager token provider, looked up once."""
+        if cls._token_provider_fn is None:
+            cls._token_provider_fn = cls._get_token_manager().get_token_provider()
+        return cls._token_provider_fn
+
+    @staticmethod
+    def _azure_kwargs(endpoint: str, api_version: str) -> dict[str, Any]:
+        """Get the endpoint and Entra ID auth arguments every Azure client takes."""
+        return {
+            "azure_endpoint": endpoint,
+            "azure_ad_token_provider": ModelFactory._token_provider(),
+            "api_version": api_version,
+        }
+
     @staticmethod
     def create_genai_model(settings: Settings) -> Any:
         """Create Azure OpenAI client for chat completions.
 
         Returns an openai.AzureOpenAI client configured with Entra ID auth.
+        Clients are cached per endpoint and API version.
         """
+        return ModelFactory._genai_client(
+            settings.azure_openai_endpoint, settings.azure_openai_api_version
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _genai_client(endpoint: str, api_version: str) -> Any:
         from openai import AzureOpenAI
 
-        logger.info(f"Creating AzureOpenAI client for endpoint: {settings.azure_openai_endpoint}")
+        logger.info("Creating AzureOpenAI client for endpoint: %s", endpoint)
         try:
-            token_provider = ModelFactory._get_token_manager().get_token_provider()
             client = AzureOpenAI(
-                azure_endpoint=settings.azure_openai_endpoint,
-                azure_ad_token_provider=token_provider,
-                api_version=settings.azure_openai_api_version,
+                **ModelFactory._azure_kwargs(endpoint, api_version),
+                http_client=get_http_client(),
             )
             logger.info("AzureOpenAI client created successfully")
             return client
         except Exception as e:
-            logger.error(f"Failed to create AzureOpenAI client: {str(e)}", exc_info=True)
+            logger.error("Failed to create AzureOpenAI client: %s", e)
+            raise
+
+    @staticmethod
+    def create_async_genai_model(settings: Settings) -> Any:
+        """Create async Azure OpenAI client for chat completions.
+
+        Returns an openai.AsyncAzureOpenAI client configured with Entra ID auth.
+        Clients are cached per endpoint and API version.
+        """
+        return ModelFactory._async_genai_client(
+            settings.azure_openai_endpoint, settings.azure_openai_api_version
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _async_genai_client(endpoint: str, api_version: str) -> Any:
+        from openai import AsyncAzureOpenAI
+
+        logger.info("Creating AsyncAzureOpenAI client for endpoint: %s", endpoint)
+        try:
+            client = AsyncAzureOpenAI(
+                **ModelFactory._azure_kwargs(endpoint, api_version),
+                http_client=get_async_http_client(),
+            )
+            logger.info("AsyncAzureOpenAI client created successfully")
+            return client
+        except Exception as e:
+            logger.error("Failed to create AsyncAzureOpenAI client: %s", e)
             raise
 
     @staticmethod
@@ -59,52 +189,62 @@ class ModelFactory:
         """Create model for PydanticAI (used by explainer agent).
 
         Returns pydantic_ai.models.openai.OpenAIChatModel with Azure config.
+        Models are cached per endpoint, deployment and API version.
         """
-        from openai import AsyncAzureOpenAI
+        return ModelFactory._pydantic_ai_model(
+            settings.azure_openai_endpoint,
+            settings.azure_openai_deployment,
+            settings.azure_openai_api_version,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _pydantic_ai_model(endpoint: str, deployment: str, api_version: str) -> Any:
         from pydantic_ai.models.openai import OpenAIChatModel
         from pydantic_ai.providers.openai import OpenAIProvider
 
-        logger.info(
-            f"Creating PydanticAI model with deployment: {settings.azure_openai_deployment}"
-        )
+        logger.info("Creating PydanticAI model with deployment: %s", deployment)
         try:
-            token_provider = ModelFactory._get_token_manager().get_token_provider()
-            azure_client = AsyncAzureOpenAI(
-                azure_endpoint=settings.azure_openai_endpoint,
-                azure_ad_token_provider=token_provider,
-                api_version=settings.azure_openai_api_version,
-            )
+            azure_client = ModelFactory._async_genai_client(endpoint, api_version)
             model = OpenAIChatModel(
-                settings.azure_openai_deployment,
+                deployment,
                 provider=OpenAIProvider(openai_client=azure_client),
             )
             logger.info("PydanticAI model created successfully")
             return model
         except Exception as e:
-            logger.error(f"Failed to create PydanticAI model: {str(e)}", exc_info=True)
+            logger.error("Failed to create PydanticAI model: %s", e)
             raise
 
     @staticmethod
     def create_agno_model(settings: Settings) -> Any:
         """Create model for Agno (used by knowledge agent).
 
-        Returns agno.models.azure.AzureOpenAI.
+        Returns agno.models.azure.AzureOpenAI. Models are cached per
+        endpoint, deployment and API version.
         """
+        return ModelFactory._agno_model(
+            settings.azure_openai_endpoint,
+            settings.azure_openai_deployment,
+            settings.azure_openai_api_version,
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _agno_model(endpoint: str, deployment: str, api_version: str) -> Any:
         from agno.models.azure import AzureOpenAI
 
-        logger.info(f"Creating Agno model with deployment: {settings.azure_openai_deployment}")
+        logger.info("Creating Agno model with deployment: %s", deployment)
         try:
-            token_provider = ModelFactory._get_token_manager().get_token_provider()
             model = AzureOpenAI(
-                id=settings.azure_openai_deployment,
-                azure_endpoint=settings.azure_openai_endpoint,
-                azure_ad_token_provider=token_provider,
-                api_version=settings.azure_openai_api_version,
+                id=deployment,
+                **ModelFactory._azure_kwargs(endpoint, api_version),
+                http_client=get_http_client(),
             )
             logger.info("Agno model created successfully")
             return model
         except Exception as e:
-            logger.error(f"Failed to create Agno model: {str(e)}", exc_info=True)
+            logger.error("Failed to create Agno model: %s", e)
             raise
 
     @staticmethod
@@ -112,12 +252,14 @@ class ModelFactory:
         """Create LLM for CrewAI (used by research agent).
 
         Uses CrewAI's native LLM class with Azure OpenAI configuration.
-        Sets AZURE_AD_TOKEN environment variable for authentication.
+        Sets AZURE_AD_TOKEN environment variable for authentication. Not
+        cached: the LLM reads the token when built, so callers rebuild it
+        after a token refresh.
         """
         from crewai import LLM
 
         logger.info(
-            f"Creating CrewAI LLM with deployment: azure/{settings.azure_openai_deployment}"
+            "Creating CrewAI LLM with deployment: azure/%s", settings.azure_openai_deployment
         )
         try:
             # Set environment variables for CrewAI's Azure provider
@@ -131,7 +273,7 @@ class ModelFactory:
             logger.info("CrewAI LLM created successfully")
             return llm
         except Exception as e:
-            logger.error(f"Failed to create CrewAI LLM: {str(e)}", exc_info=True)
+            logger.error("Failed to create CrewAI LLM: %s", e)
             raise
 
     @staticmethod
@@ -139,24 +281,22 @@ class ModelFactory:
         """Create Azure OpenAI client for embeddings.
 
         Returns an openai.AzureOpenAI client configured for embedding operations.
+        This is the same cached client ``create_genai_model`` returns; the
+        deployment is chosen per request.
         """
-        from openai import AzureOpenAI
-
         logger.info(
-            f"Creating embedding client for model: {settings.azure_openai_embedding_deployment}"
+            "Using embedding client for model: %s", settings.azure_openai_embedding_deployment
         )
-        try:
-            token_provider = ModelFactory._get_token_manager().get_token_provider()
-            client = AzureOpenAI(
-                azure_endpoint=settings.azure_openai_endpoint,
-                azure_ad_token_provider=token_provider,
-                api_version=settings.azure_openai_api_version,
-            )
-            logger.info("Embedding client created successfully")
-            return client
-        except Exception as e:
-            logger.error(f"Failed to create embedding client: {str(e)}", exc_info=True)
-            raise
+        return ModelFactory.create_genai_model(settings)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop cached clients, models and token provider. Primarily for testing."""
+        ModelFactory._token_provider_fn = None
+        ModelFactory._genai_client.cache_clear()
+        ModelFactory._async_genai_client.cache_clear()
+        ModelFactory._pydantic_ai_model.cache_clear()
+        ModelFactory._agno_model.cache_clear()
 
     @staticmethod
     def get_provider_info(settings: Settings) -> dict[str, str]:
@@ -0,0 +1,46 @@
+"""Server-side helpers shared by the agent A2A servers."""
+
+from __future__ import annotations
+
+import importlib.util
+from typing import TYPE_CHECKING, Any
+
+import orjson
+import uvicorn
+from fastapi.responses import JSONResponse
+
+if TYPE_CHECKING:
+    from shared.config import Settings
+
+# uvloop has no Windows build; uvicorn's "auto" loop falls back to asyncio
+_LOOP = "uvloop" if importlib.util.find_spec("uvloop") is not None else "auto"
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder.
+
+    Defined here because FastAPI deprecated its own ``ORJSONResponse``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def run_a2a_server(app: str, settings: Settings) -> None:
+    """Serve an agent's ASGI app with uvloop and httptools.
+
+    Args:
+        app: Import string of the app, e.g. ``"agents.research.a2a_server:app"``
+        settings: Agent settings with host, port and worker count
+    """
+    uvicorn.run(
+        app,
+        host=settings.host,
+        port=settings.port,
+        reload=False,
+        loop=_LOOP,
+        http="httptools",
+        workers=settings.workers,
+        backlog=2048,
+        timeout_keep_alive=75,
+    )
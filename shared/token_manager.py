@@ -7,6 +7,7 @@ all agents in the multi-agent system. Automatically refreshes tokens
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import threading
@@ -23,24 +24,42 @@ if TYPE_CHECKING:
 # Set up module logger
 logger = logging.getLogger("token-manager")
 
+# Entra ID scope for Azure OpenAI (Cognitive Services) tokens
+COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+
 # Refresh token 10 minutes before expiration
 TOKEN_REFRESH_BUFFER_SECONDS = 600
 
+# Background refresh runs this long before the refresh deadline, so
+# requests rarely have to fetch a token themselves
+BACKGROUND_REFRESH_LEAD_SECONDS = 30
+
+# azure-identity keeps returning its cached token until this close to
+# expiry, then retries renewal at most this often
+CREDENTIAL_REFRESH_OFFSET_SECONDS = 300
+CREDENTIAL_RETRY_SECONDS = 30
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CachedToken:
-    """Cached token with expiration tracking."""
+    """Cached token with expiration tracking.
+
+    Immutable, so ``get_token`` can read it without the lock: a refresh
+    publishes a whole new instance with one attribute store.
+    """
 
     token: str
     expires_at: float  # Unix timestamp
+    refresh_at: float  # Unix timestamp; when to ask the credential again
 
 
 class TokenManager:
     """Thread-safe singleton for Azure AD token management.
 
-    Automatically refreshes tokens 10 minutes before expiration.
-    Provides both raw tokens and token provider functions for different
-    frameworks (OpenAI, PydanticAI, Agno, CrewAI, LangChain).
+    Automatically refreshes tokens 10 minutes before expiration, normally
+    from a background timer just ahead of that deadline. Provides both raw
+    tokens and token provider functions for different frameworks (OpenAI,
+    PydanticAI, Agno, CrewAI, LangChain).
 
     Usage:
         # Initialize once at application startup
@@ -55,40 +74,42 @@ class TokenManager:
     """
 
     _instance: TokenManager | None = None
-    _lock = threading.Lock()
-
-    def __new__(cls, settings: Settings | None = None) -> TokenManager:
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    instance = super().__new__(cls)
-                    instance._initialized = False
-                    cls._instance = instance
-        return cls._instance
-
-    def __init__(self, settings: Settings | None = None) -> None:
-        if self._initialized:
-            return
-        if settings is None:
-            raise ValueError("Settings required for first TokenManager initialization")
 
+    def __init__(self, settings: Settings) -> None:
         self._settings = settings
         self._cached_token: CachedToken | None = None
         self._token_lock = threading.Lock()
+        self._async_refresh_lock = asyncio.Lock()
         self._credential = None
-        self._initialized = True
+        self._refresh_timer: threading.Timer | None = None
+        self._env_token: str | None = None  # token last written to the environment
         logger.info("TokenManager initialized")
 
     def _get_credential(self):
-        """Lazily initialize Azure credential."""
+        """Lazily initialize Azure credential.
+
+        The credential keeps MSAL's in-memory token cache; with
+        ``azure_token_cache_persistent`` set, that cache is also persisted
+        so a restarted agent can reuse a still-valid token.
+
+        Must be called with ``_token_lock`` held, so concurrent first
+        refreshes share a single credential.
+        """
         if self._credential is None:
-            from azure.identity import ClientSecretCredential
+            from azure.identity import ClientSecretCredential, TokenCachePersistenceOptions
 
             logger.debug("Creating Azure ClientSecretCredential")
+            options = {}
+            if self._settings.azure_token_cache_persistent:
+                options["cache_persistence_options"] = TokenCachePersistenceOptions(
+                    name="multi-agent-a2a",
+                    allow_unencrypted_storage=self._settings.azure_token_cache_allow_unencrypted,
+                )
             self._credential = ClientSecretCredential(
                 tenant_id=self._settings.azure_tenant_id,
                 client_id=self._settings.azure_client_id,
                 client_secret=self._settings.azure_client_secret,
+                **options,
             )
         return self._credential
 
@@ -96,14 +117,17 @@ class TokenManager:
         """Check if cached token is valid (not expired + buffer)."""
         if self._cached_token is None:
             return False
-        return time.time() < (self._cached_token.expires_at - TOKEN_REFRESH_BUFFER_SECONDS)
+        return time.time() < self._cached_token.refresh_at
 
     def _refresh_token(self) -> AccessToken:
-        """Get a fresh token from Azure AD."""
+        """Get a fresh token from Azure AD.
+
+        Must be called with ``_token_lock`` held.
+        """
         logger.info("Refreshing Azure AD token...")
         try:
             credential = self._get_credential()
-            token = credential.get_token("https://cognitiveservices.azure.com/.default")
+            token = credential.get_token(COGNITIVE_SERVICES_SCOPE)
             logger.info("Successfully acquired Azure AD token")
             return token
         except Exception as e:
@@ -139,19 +163,90 @@ class TokenManager:
 
         Thread-safe method that returns a valid token. If the cached token
         is expired or will expire within 10 minutes, a new token is fetched.
+        The lock is only taken on a cache miss, so the common path is a
+        single timestamp comparison.
 
         Returns:
             str: A valid Azure AD access token.
         """
+        cached = self._cached_token
+        if cached is not None and time.time() < cached.refresh_at:
+            return cached.token
+
         with self._token_lock:
             if not self._is_token_valid():
-                access_token = self._refresh_token()
-                self._cached_token = CachedToken(
-                    token=access_token.token,
-                    expires_at=access_token.expires_on,
-                )
+                self._store_token(self._refresh_token())
+            return self._cached_token.token
+
+    def _store_token(self, access_token: AccessToken) -> None:
+        """Cache a token from the credential and schedule its background refresh.
+
+        A new token is refreshed 10 minutes before expiration. If the
+        credential handed back the token already cached, it has not renewed
+        yet, so the next attempt waits until the credential will: 5 minutes
+        before expiration, then every 30 seconds.
+
+        Must be called with ``_token_lock`` held.
+        """
+        now = time.time()
+        expires_at = access_token.expires_on
+        cached = self._cached_token
+        if cached is not None and cached.token == access_token.token:
+            logger.debug("Credential returned the cached token; retrying closer to expiry")
+            refresh_at = max(
+                expires_at - CREDENTIAL_REFRESH_OFFSET_SECONDS, now + CREDENTIAL_RETRY_SECONDS
+            )
+            refresh_at = min(refresh_at, expires_at)
+            lead = 0
+        else:
+            refresh_at = expires_at - TOKEN_REFRESH_BUFFER_SECONDS
+            lead = BACKGROUND_REFRESH_LEAD_SECONDS
+        self._cached_token = CachedToken(
+            token=access_token.token,
+            expires_at=expires_at,
+            refresh_at=refresh_at,
+        )
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+        delay = refresh_at - now - lead
+        self._refresh_timer = threading.Timer(max(1.0, delay), self._background_refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _background_refresh(self) -> None:
+        """Refresh the token from the timer thread.
+
+        On failure the cached token is kept; the next ``get_token`` call
+        after the refresh deadline retries synchronously.
+        """
+        with self._token_lock:
+            try:
+                self._store_token(self._refresh_token())
+            except Exception:
+                logger.warning("Background token refresh failed; retrying on next use")
+
+    def stop(self) -> None:
+        """Cancel the pending background refresh."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+    async def ensure_fresh(self) -> str:
+        """Get a valid Azure AD token without blocking the event loop.
+
+        Returns the cached token when it is still valid. Otherwise the
+        blocking credential call runs in a worker thread, and concurrent
+        callers wait on a single refresh instead of each starting one.
+
+        Returns:
+            str: A valid Azure AD access token.
+        """
+        if self._is_token_valid():
             return self._cached_token.token
 
+        async with self._async_refresh_lock:
+            return await asyncio.to_thread(self.get_token)
+
     def get_token_provider(self) -> Callable[[], str]:
         """Get a token provider function for Azure OpenAI clients.
 
@@ -172,9 +267,15 @@ class TokenManager:
         - AZURE_API_BASE: Azure OpenAI endpoint
         - AZURE_API_VERSION: API version
         """
-        os.environ["AZURE_API_KEY"] = self.get_token()
-        os.environ["AZURE_API_BASE"] = self._settings.azure_openai_endpoint
-        os.environ["AZURE_API_VERSION"] = self._settings.azure_openai_api_version
+        token = self.get_token()
+        if token == self._env_token:
+            return
+        # Endpoint and version never change, so write them with the first token
+        if self._env_token is None:
+            os.environ["AZURE_API_BASE"] = self._settings.azure_openai_endpoint
+            os.environ["AZURE_API_VERSION"] = self._settings.azure_openai_api_version
+        os.environ["AZURE_API_KEY"] = token
+        self._env_token = token
 
     def get_token_expiry(self) -> float | None:
         """Get the expiration timestamp of the current cached token.
@@ -195,9 +296,7 @@ class TokenManager:
         """
         if self._cached_token is None:
             return None
-        time_until_refresh = (
-            self._cached_token.expires_at - TOKEN_REFRESH_BUFFER_SECONDS - time.time()
-        )
+        time_until_refresh = self._cached_token.refresh_at - time.time()
         return max(0, time_until_refresh)
 
     @classmethod
@@ -205,6 +304,7 @@ class TokenManager:
         """Initialize the singleton with settings.
 
         Must be called once at application startup before any token operations.
+        Later calls return the existing instance.
 
         Args:
             settings: Application settings with Azure credentials.
@@ -212,7 +312,9 @@ class TokenManager:
         Returns:
             TokenManager: The initialized singleton instance.
         """
-        return cls(settings)
+        if cls._instance is None:
+            cls._instance = cls(settings)
+        return cls._instance
 
     @classmethod
     def get_instance(cls) -> TokenManager:
@@ -230,6 +332,14 @@ class TokenManager:
 
     @classmethod
     def reset(cls) -> None:
-        """Reset the singleton instance. Primarily for testing."""
-        with cls._lock:
-            cls._instance = None
+        """Reset the singleton instance. Primarily for testing.
+
+        Also drops ModelFactory's cached clients, which hold the old
+        instance's token provider.
+        """
+        from shared.models import ModelFactory
+
+        if cls._instance is not None:
+            cls._instance.stop()
+        cls._instance = None
+        ModelFactory.clear_cache()
@@ -1,10 +1,23 @@
 """Tests for A2A utilities."""
 
+from types import SimpleNamespace
+
+import httpx
+import orjson
+import pytest
 
 from shared.a2a_utils import (
+    INTERNAL_ERROR,
+    INVALID_PARAMS,
+    METHOD_NOT_FOUND,
+    A2AClient,
+    AdaptiveLimiter,
+    CircuitOpenError,
     create_a2a_error,
+    create_a2a_error_bytes,
     create_a2a_response,
     create_agent_card,
+    create_agent_card_bytes,
 )
 
 
@@ -24,21 +37,155 @@ def test_create_agent_card():
     assert card.skills[0].id == "skill-1"
 
 
-def test_create_a2a_response():
+def test_create_agent_card_bytes():
+    """Test that the serialized agent card matches the model dump."""
+    kwargs = {
+        "name": "test-agent",
+        "description": "A test agent",
+        "url": "http://localhost:8000",
+        "skills": [{"id": "skill-1", "name": "Test Skill", "description": "A test skill"}],
+    }
+
+    assert (
+        orjson.loads(create_agent_card_bytes(**kwargs)) == create_agent_card(**kwargs).model_dump()
+    )
+
+
+@pytest.mark.parametrize(
+    ("text", "request_id"),
+    [("Hello, world!", "123"), ("", "1"), ('Quote "this"\n', "abc")],
+)
+def test_create_a2a_response(text, request_id):
     """Test creating an A2A response."""
-    response = create_a2a_response("Hello, world!", "123")
+    response = create_a2a_response(text, request_id)
 
     assert response["jsonrpc"] == "2.0"
-    assert response["id"] == "123"
+    assert response["id"] == request_id
     assert "result" in response
-    assert response["result"]["message"]["parts"][0]["text"] == "Hello, world!"
+    assert response["result"]["message"]["parts"][0]["text"] == text
 
 
-def test_create_a2a_error():
+@pytest.mark.parametrize(
+    ("code", "message", "request_id"),
+    [(-32600, "Invalid request", "456"), (METHOD_NOT_FOUND, "Method not found: x", "1")],
+)
+def test_create_a2a_error(code, message, request_id):
     """Test creating an A2A error response."""
-    error = create_a2a_error(-32600, "Invalid request", "456")
+    error = create_a2a_error(code, message, request_id)
 
     assert error["jsonrpc"] == "2.0"
-    assert error["id"] == "456"
-    assert error["error"]["code"] == -32600
-    assert error["error"]["message"] == "Invalid request"
+    assert error["id"] == request_id
+    assert error["error"]["code"] == code
+    assert error["error"]["message"] == message
+
+
+@pytest.mark.parametrize("code", [INVALID_PARAMS, INTERNAL_ERROR, -32000])
+def test_create_a2a_error_bytes(code):
+    """Test that pre-encoded errors match create_a2a_error for any code."""
+    error = create_a2a_error_bytes(code, 'Bad "query"', "789")
+    assert orjson.loads(error) == create_a2a_error(code, 'Bad "query"', "789")
+
+
+async def test_send_task_payload():
+    """Test that the pre-encoded tasks/send envelope is valid JSON-RPC."""
+    sent = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent["body"] = orjson.loads(request.content)
+        return httpx.Response(200, json={"jsonrpc": "2.0", "result": {}, "id": "7"})
+
+    client = A2AClient("http://agent")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with client:
+        await client.send_task('Say "hi"\n', task_id="7")
+
+    assert sent["body"] == {
+        "jsonrpc": "2.0",
+        "method": "tasks/send",
+        "params": {"message": {"role": "user", "parts": [{"text": 'Say "hi"\n'}]}},
+        "id": "7",
+    }
+
+
+async def test_send_task_circuit_opens_after_failures():
+    """Test that repeated failures stop further calls to the agent."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(500)
+
+    client = A2AClient("http://agent")
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with client:
+        for _ in range(client._limiter.failure_threshold):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.send_task("hi")
+        with pytest.raises(CircuitOpenError):
+            await client.send_task("hi")
+
+    assert len(calls) == client._limiter.failure_threshold
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("shared.a2a_utils.time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+async def test_limiter_half_open_admits_one_trial(clock):
+    """Test that after the cooldown only one trial call runs until it succeeds."""
+    limiter = AdaptiveLimiter("agent", failure_threshold=1, cooldown=10)
+    await limiter.acquire()
+    limiter.release(0.1, failed=True)
+
+    clock[0] += 9
+    with pytest.raises(CircuitOpenError):
+        await limiter.acquire()
+
+    clock[0] += 1
+    assert await limiter.acquire() is True
+    with pytest.raises(CircuitOpenError):
+        await limiter.acquire()
+
+    limiter.release(0.1, trial=True)
+    assert await limiter.acquire() is False
+    assert await limiter.acquire() is False
+
+
+@pytest.mark.parametrize(
+    ("failed", "latency", "reopens"), [(True, 0.1, True), (False, None, False)]
+)
+async def test_limiter_trial_failure_reopens(clock, failed, latency, reopens):
+    """Test that a failed trial reopens the circuit and a cancelled one is retried."""
+    limiter = AdaptiveLimiter("agent", failure_threshold=1, cooldown=10)
+    await limiter.acquire()
+    limiter.release(0.1, failed=True)
+    clock[0] += 10
+    assert await limiter.acquire() is True
+
+    limiter.release(latency, failed=failed, trial=True)
+    if reopens:
+        with pytest.raises(CircuitOpenError):
+            await limiter.acquire()
+    else:
+        assert await limiter.acquire() is True
+
+
+async def test_limiter_limit_adapts_to_latency(clock):
+    """Test that the cap grows on steady latency and shrinks on spikes and failures."""
+    limiter = AdaptiveLimiter("agent", max_limit=20, initial_limit=4)
+    for _ in range(8):
+        await limiter.acquire()
+        limiter.release(0.1)
+    grown = limiter.limit
+    assert grown > 4
+
+    await limiter.acquire()
+    limiter.release(5.0)
+    assert limiter.limit == pytest.approx(grown * 0.75)
+
+    await limiter.acquire()
+    limiter.release(0.1, failed=True)
+    assert limiter.limit == pytest.approx(grown * 0.75 * 0.75)
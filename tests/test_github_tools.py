@@ -0,0 +1,117 @@
+"""Tests for the research agent's GitHub tools."""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+pytest.importorskip("crewai")
+pytest.importorskip("firecrawl")
+
+from agents.research.cache import TTLCache  # noqa: E402
+from agents.research.tools import github  # noqa: E402
+
+
+class FakeGitHub:
+    """GitHub API handler that honours If-None-Match against a current ETag."""
+
+    def __init__(self):
+        self.etag = '"v1"'
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304)
+        if request.url.path.endswith("/readme"):
+            return httpx.Response(200, text="Hello from the README")
+        if request.url.path == "/search/repositories":
+            items = [{"full_name": "o/r", "stargazers_count": 5, "description": self.etag}]
+            return httpx.Response(200, json={"items": items}, headers={"ETag": self.etag})
+        repo = {"full_name": "o/r", "description": f"version {self.etag}"}
+        return httpx.Response(200, json=repo, headers={"ETag": self.etag})
+
+    def paths(self) -> list[str]:
+        paths = [r.url.path for r in self.requests]
+        self.requests.clear()
+        return paths
+
+
+@pytest.fixture
+def api(monkeypatch):
+    api = FakeGitHub()
+    transport = httpx.MockTransport(api)
+    monkeypatch.setattr(github, "_sync_client", httpx.Client(transport=transport))
+    monkeypatch.setattr(github, "_async_client", httpx.AsyncClient(transport=transport))
+    monkeypatch.setattr(github, "_search_cache", TTLCache(maxsize=8, ttl=600))
+    monkeypatch.setattr(github, "_details_caches", {})
+    yield api
+    for cache in github._details_caches.values():
+        cache.close()
+
+
+def test_details_revalidated_with_etag(api, tmp_path):
+    """Test that an unchanged repository is served from disk on a 304."""
+    tool = github.GitHubRepoDetailsTool(token="t", cache_dir=str(tmp_path))
+    details = tool._run("o/r")
+    assert "Hello from the README" in details
+    assert sorted(api.paths()) == ["/repos/o/r", "/repos/o/r/readme"]
+
+    assert tool._run("o/r") == details
+    assert api.requests[0].headers["If-None-Match"] == '"v1"'
+    assert api.paths() == ["/repos/o/r"]
+
+
+def test_details_refetched_when_changed(api, tmp_path):
+    """Test that a changed repository refetches the README and replaces the entry."""
+    tool = github.GitHubRepoDetailsTool(token="t", cache_dir=str(tmp_path))
+    tool._run("o/r")
+    api.paths()
+
+    api.etag = '"v2"'
+    assert 'version "v2"' in tool._run("o/r")
+    assert api.paths() == ["/repos/o/r", "/repos/o/r/readme"]
+    assert github._get_details_cache(str(tmp_path)).get("o/r")["etag"] == '"v2"'
+
+
+def test_details_past_max_age_fetched_unconditionally(api, tmp_path):
+    """Test that an entry older than the max age is not revalidated."""
+    tool = github.GitHubRepoDetailsTool(token="t", cache_dir=str(tmp_path))
+    tool._run("o/r")
+    api.paths()
+    cache = github._get_details_cache(str(tmp_path))
+    entry = cache.get("o/r")
+    entry["stored_at"] -= github.DETAILS_CACHE_MAX_AGE + 1
+    cache.set("o/r", entry)
+
+    tool._run("o/r")
+    assert all("If-None-Match" not in r.headers for r in api.requests)
+    assert sorted(api.paths()) == ["/repos/o/r", "/repos/o/r/readme"]
+
+
+async def test_async_details_revalidated_with_etag(api, tmp_path):
+    """Test that the async details path also serves a 304 from disk."""
+    tool = github.GitHubRepoDetailsTool(token="t", cache_dir=str(tmp_path))
+    details = await tool._arun("o/r")
+    api.paths()
+
+    assert await tool._arun("o/r") == details
+    assert api.paths() == ["/repos/o/r"]
+
+
+def test_stale_search_revalidated_with_etag(api, monkeypatch):
+    """Test that a stale search is revalidated, and a 304 makes it fresh again."""
+    now = [1000.0]
+    monkeypatch.setattr("agents.research.cache.time", SimpleNamespace(time=lambda: now[0]))
+    tool = github.GitHubSearchTool()
+    result = tool._run("agents")
+    assert "**o/r**" in result
+    api.paths()
+
+    now[0] += 600
+    assert tool._run("agents") == result
+    assert api.requests[0].headers["If-None-Match"] == '"v1"'
+    assert api.paths() == ["/search/repositories"]
+
+    assert tool._run("agents") == result
+    assert api.paths() == []
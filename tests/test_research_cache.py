@@ -0,0 +1,138 @@
+"""Tests for the research agent caches."""
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+from agents.research.cache import DiskCache, ResearchCache, TTLCache
+from agents.research.config import ResearchSettings
+
+
+class FakeEmbeddings:
+    """Embedding client that returns fixed vectors per query."""
+
+    def __init__(self, vectors: dict[str, list[float]]):
+        self.vectors = vectors
+        self.calls = 0
+        self.embeddings = self
+
+    def create(self, model: str, input: str) -> SimpleNamespace:
+        self.calls += 1
+        if input not in self.vectors:
+            raise RuntimeError("embedding deployment unavailable")
+        return SimpleNamespace(data=[SimpleNamespace(embedding=self.vectors[input])])
+
+
+def at_angle(cosine: float) -> list[float]:
+    """A 2-D vector whose cosine similarity with [1, 0] is the given value."""
+    return [cosine, math.sqrt(1 - cosine * cosine)]
+
+
+def make_cache(vectors: dict[str, list[float]], **overrides) -> ResearchCache:
+    settings = ResearchSettings(firecrawl_api_key="test", semantic_cache_threshold=0.9, **overrides)
+    cache = ResearchCache(settings)
+    cache._embedding_client = FakeEmbeddings(vectors)
+    return cache
+
+
+async def test_exact_hit_ignores_case_and_whitespace():
+    """Test that a normalized query matches without embedding it."""
+    cache = make_cache({}, semantic_cache_enabled=False)
+    await cache.set("What is  LangGraph?", "report")
+
+    assert await cache.get("what is langgraph?") == "report"
+    assert cache.stats["hits"] == 1
+    assert cache._embedding_client.calls == 0
+
+
+@pytest.mark.parametrize(("cosine", "expected"), [(0.95, "report"), (0.85, None)])
+async def test_semantic_lookup_respects_threshold(cosine, expected):
+    """Test that a similar query hits only above the similarity threshold."""
+    cache = make_cache({"stored": [1.0, 0.0], "similar": at_angle(cosine)})
+    await cache.set("stored", "report")
+
+    assert await cache.get("similar") == expected
+    assert cache.stats["semantic_hits"] == (expected is not None)
+
+
+async def test_entries_expire_after_ttl(monkeypatch):
+    """Test that an entry is dropped once its TTL has passed."""
+    now = [1000.0]
+    monkeypatch.setattr("agents.research.cache.time", SimpleNamespace(time=lambda: now[0]))
+    cache = make_cache({}, semantic_cache_enabled=False, cache_ttl_seconds=60)
+    await cache.set("query", "report")
+
+    now[0] += 59
+    assert await cache.get("query") == "report"
+    now[0] += 1
+    assert await cache.get("query") is None
+
+
+async def test_least_recently_used_entry_is_evicted():
+    """Test that a full cache evicts the entry used longest ago."""
+    cache = make_cache({}, semantic_cache_enabled=False, cache_max_entries=2)
+    await cache.set("a", "report-a")
+    await cache.set("b", "report-b")
+    assert await cache.get("a") == "report-a"
+    await cache.set("c", "report-c")
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == "report-a"
+    assert await cache.get("c") == "report-c"
+
+
+async def test_embedding_failure_falls_back_to_exact_match():
+    """Test that a failing embedding call leaves the exact tier working."""
+    cache = make_cache({})
+    await cache.set("query", "report")
+
+    assert await cache.get("query") == "report"
+    assert await cache.get("other query") is None
+    assert cache.stats == {"hits": 1, "semantic_hits": 0, "misses": 1}
+
+
+def test_ttl_cache_keeps_stale_entries_until_touched(monkeypatch):
+    """Test that a stale entry is still available for revalidation."""
+    now = [1000.0]
+    monkeypatch.setattr("agents.research.cache.time", SimpleNamespace(time=lambda: now[0]))
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("key", "value")
+
+    now[0] += 60
+    assert cache.get("key") is None
+    assert cache.get_entry("key") == ("value", False)
+
+    cache.touch("key")
+    assert cache.get_entry("key") == ("value", True)
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that reading an entry protects it from eviction."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get_entry("b") is None
+    assert cache.get("a") == 1
+
+
+def test_disk_cache_persists_across_reopen(tmp_path):
+    """Test that values survive closing and reopening the shelf."""
+    cache = DiskCache(str(tmp_path / "cache" / "shelf"))
+    cache.set("key", {"etag": "abc"})
+    cache.close()
+
+    assert DiskCache(str(tmp_path / "cache" / "shelf")).get("key") == {"etag": "abc"}
+
+
+def test_disk_cache_errors_are_misses(tmp_path):
+    """Test that an unusable cache path never raises."""
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = DiskCache(str(blocker / "shelf"))
+
+    cache.set("key", "value")
+    assert cache.get("key") is None
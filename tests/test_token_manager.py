@@ -0,0 +1,100 @@
+"""Tests for the Azure AD token manager."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from shared.config import Settings
+from shared.token_manager import (
+    CREDENTIAL_REFRESH_OFFSET_SECONDS,
+    TOKEN_REFRESH_BUFFER_SECONDS,
+    TokenManager,
+)
+
+
+class FakeCredential:
+    """Credential that hands out numbered tokens with a fixed lifetime."""
+
+    def __init__(self, lifetime: float):
+        self.lifetime = lifetime
+        self.calls = 0
+
+    def get_token(self, scope: str) -> SimpleNamespace:
+        self.calls += 1
+        return SimpleNamespace(token=f"token-{self.calls}", expires_on=time.time() + self.lifetime)
+
+
+class CachingCredential:
+    """Credential that, like azure-identity, reuses its token until near expiry."""
+
+    def __init__(self, clock, lifetime: float):
+        self.clock = clock
+        self.lifetime = lifetime
+        self.calls = 0
+        self.issued = 0
+        self.token = None
+
+    def get_token(self, scope: str) -> SimpleNamespace:
+        self.calls += 1
+        now = self.clock()
+        if self.token is None or self.token.expires_on - now <= CREDENTIAL_REFRESH_OFFSET_SECONDS:
+            self.issued += 1
+            self.token = SimpleNamespace(
+                token=f"token-{self.issued}", expires_on=now + self.lifetime
+            )
+        return self.token
+
+
+@pytest.fixture
+def manager():
+    TokenManager.reset()
+    manager = TokenManager.initialize(Settings())
+    yield manager
+    TokenManager.reset()
+
+
+def test_get_token_uses_cache_while_valid(manager):
+    """Test that a valid cached token is returned without a refresh."""
+    credential = FakeCredential(lifetime=3600)
+    manager._credential = credential
+
+    assert manager.get_token() == "token-1"
+    assert manager.get_token() == "token-1"
+    assert credential.calls == 1
+
+
+def test_get_token_refreshes_inside_buffer(manager):
+    """Test that a token expiring within the refresh buffer is replaced."""
+    credential = FakeCredential(lifetime=TOKEN_REFRESH_BUFFER_SECONDS - 1)
+    manager._credential = credential
+
+    assert manager.get_token() == "token-1"
+    assert manager.get_token() == "token-2"
+    assert credential.calls == 2
+
+
+def test_unchanged_token_waits_for_credential_renewal(manager, monkeypatch):
+    """Test that a token the credential has not renewed yet is not re-requested."""
+    now = [1000.0]
+    monkeypatch.setattr("shared.token_manager.time", SimpleNamespace(time=lambda: now[0]))
+    credential = CachingCredential(lambda: now[0], lifetime=3600)
+    manager._credential = credential
+
+    assert manager.get_token() == "token-1"
+    expires_at = now[0] + 3600
+
+    # Inside our buffer but before the credential renews: one call, same token
+    now[0] = expires_at - TOKEN_REFRESH_BUFFER_SECONDS
+    assert manager.get_token() == "token-1"
+    assert credential.calls == 2
+    renews_at = expires_at - CREDENTIAL_REFRESH_OFFSET_SECONDS
+    assert manager._refresh_timer.interval == renews_at - now[0]
+
+    now[0] = renews_at - 1
+    assert manager.get_token() == "token-1"
+    assert credential.calls == 2
+
+    now[0] = renews_at
+    assert manager.get_token() == "token-2"
+    assert credential.calls == 3